@@ -15,6 +15,10 @@ import os
 from openpyxl import load_workbook
 from openpyxl.styles import Alignment, Font
 from openpyxl.utils.dataframe import dataframe_to_rows
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def format_excel_table(file_path):
     wb = load_workbook(file_path)
@@ -64,7 +68,7 @@ output_file = "results/tables/tab3_phase_3_descriptive.xlsx"
 
 def calculate_statistics(file_path, currency):
     # Read the Excel file
-    df = pd.read_excel(file_path)
+    df = read_excel(file_path)
 
     # Filter out any transactions in the Type column that are of the type 'IRS Fix-Fix'
     df = df[df["Type"] != "IRS Fix-Fix"]
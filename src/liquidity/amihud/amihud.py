@@ -4,6 +4,11 @@
 import pandas as pd
 import numpy as np
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def calculate_average_daily_return(prices):
     """
@@ -65,7 +70,7 @@ def apply_measures(group):
 
 def main(input_file, output_file, tenor, currency):
     # Read data and create columns for tenor
-    df = pd.read_excel(input_file)
+    df = read_excel(input_file)
     df['Tenor'] = np.round((df['Maturity'] - df['Effective']).dt.days / 365.25)
     df['Trade Date'] = df['Trade Time'].dt.date
     # Calculate the difference in days between Effective date and Trade Date
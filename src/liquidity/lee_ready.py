@@ -10,6 +10,11 @@
 import argparse
 import pandas as pd
 import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def recode_rates(rate):
     """ Recode rates to account for basis points. """
@@ -38,7 +43,7 @@ def apply_lee_ready_to_group(group):
 def process_file(input_file, output_file):
     """ Process the Excel file to recode rates and apply Lee and Ready algorithm. """
     # Read the Excel file
-    data = pd.read_excel(input_file)
+    data = read_excel(input_file)
 
     # Convert date time columns to datetime objects
     data['Trade Time'] = pd.to_datetime(data['Trade Time'])
@@ -2,10 +2,15 @@
 
 import pandas as pd
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def compute_bid_ask_spread(file_name):
     # Load the dataset
-    df = pd.read_excel(file_name)
+    df = read_excel(file_name)
     
     # Apply filters
     filtered_df = df[
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 
-import pandas as pd
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def rolls_estimator(prices):
     '''Take a vector of prices and calculate the Roll Measure'''
@@ -26,7 +30,7 @@ def apply_filters_and_sort(df):
 
 def compute_bid_ask_spread(file_name):
     # Load the dataset
-    df = pd.read_excel(file_name)
+    df = read_excel(file_name)
     
     # Apply filters and sort data
     filtered_df = apply_filters_and_sort(df)
@@ -2,6 +2,11 @@
 
 import pandas as pd
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 # Function to calculate Roll's spread estimator for groups
 def rolls_estimator(group):
@@ -11,7 +16,7 @@ def rolls_estimator(group):
 
 def compute_roll_measure_by_group(file_name):
     # Load the dataset
-    df = pd.read_excel(file_name)
+    df = read_excel(file_name)
 
     df = df.sort_values(by=['Trade Time'])
     
@@ -1,5 +1,10 @@
 import pandas as pd
 import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utils'))
+from excel_cache import read_excel  # noqa: E402
 
 def recode_rates(rate):
     """ Recode rates to account for basis points. """
@@ -9,7 +14,7 @@ def recode_rates(rate):
 
 def calculate_bid_ask_spread(file_path):
     # Load the Excel file
-    df = pd.read_excel(file_path)
+    df = read_excel(file_path)
     
     # Convert 'Trade Time' and 'Effective' to datetime
     df['Trade Time'] = pd.to_datetime(df['Trade Time'])
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+# Name: benchmark_curves.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script bootstraps each currency's curve with several curve types (flat
+# forward, log-linear and log-cubic discount, monotone convex, ...) and reports bootstrap time,
+# pricing time per trade and the change of 'Difference' against the flat-forward curve.
+#
+# Example:
+#   ./src/pricing/benchmark_curves.py trades.xlsx 2013-03-11 \
+#       --curve USD=data/raw/curves/USD/usd_03112013.xlsx --tolerance 0.05
+
+from irs_pricing.curve_benchmark import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+# Name: benchmark_pricing.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script benchmarks swap pricing on synthetic curve quote sheets and SDR
+# trades, and reports bootstrap time, swaps per second and peak memory at 1k, 100k and 1M
+# trades for each pricing backend.
+#
+# Example:
+#   ./src/pricing/benchmark_pricing.py --trades 100000 --backend vectorized \
+#       --save_inputs data/synthetic --output_file benchmark.csv
+
+from irs_pricing.benchmarks import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+# Name: convert_workbooks.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script parses Excel workbooks once and stores each as a Feather sidecar
+# next to it (or in $EXCEL_SIDECAR_DIR), so that the pricing and analysis scripts load the
+# sidecar instead of re-parsing the workbook until it changes.
+#
+# Example:
+#   ./src/pricing/convert_workbooks.py data/raw/trades/USD/*.xlsx data/raw/curves/USD/*.xlsx
+
+from irs_pricing.excel import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# Name: irs_pricing
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Multi-currency interest rate swap pricing with QuantLib.
+
+from .conventions import CONVENTIONS, CurrencyConvention, HelperRule, get_convention
+from .curve_store import CurveStore, quotes_hash
+from .curves import (CURVE_TYPES, CurveCache, CurveQuotes, WarmBootstrapper, bootstrap_curve, build_helpers,
+                     build_quoted_curve, build_quoted_helpers, build_yield_curve, curve_file_loader, freeze_curve,
+                     stored_nodes)
+from .dates import (parse_date, parse_date_column, parse_date_columns, parse_trade_dates, serial_to_date,
+                    serials_to_ymd, to_ql_date, ymd_to_serials)
+from .calendars import BusinessDayTable, add_months, get_business_day_table
+from .excel import read_excel, sidecar_path
+from .files import format_path
+from .metrics import RunMetrics, get_run_metrics, reset_run_metrics
+from .fixings import FixingsStore, convert_fixings, get_fixings_store, load_fixings
+from .schedules import ScheduleCache
+from .pricer import SwapPricer, attach_prices, price_by_trade_date, price_currency, price_swaps, price_transactions
+from .forwards import ForwardCache, get_forward_cache
+from .vectorized import CurveNodes, SwapArrays, VectorizedPricer, year_fractions
+from .validation import reject_reasons, screen_trades, summarize_rejects, write_rejects
+from .sinks import SINKS, Sink, open_sink, register_sink, write_results
+from .streaming import LivePricer, StreamingPricer, TradeFeed, follow_stream, price_stream, read_transaction_chunks
+from .trade_store import TradeStore, trade_hashes
+from .risk import CurveRisk, portfolio_dv01
+from .scenarios import (CurveShock, ScenarioPricer, key_rate_shocks, parallel_shock, pillar_shock, price_scenarios,
+                        read_scenarios, twist_shock)
+from .curve_factory import CurveFactory, SharedCurves, curve_requests, publish_curves
+from .curve_benchmark import benchmark_curve_types
+from .synthetic import synthetic_curve, synthetic_trades
+from .benchmarks import benchmark_pricing
+from .service import PricingClient, PricingService, make_server
@@ -0,0 +1,207 @@
+# Name: batch.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Multi-date batch pricing. Evaluation dates are fanned out across a process
+# pool, one date per task, so each worker owns its global ql.Settings evaluation date.
+# The results of all dates are written once at the end.
+
+import argparse
+import logging
+import os
+from multiprocessing import Pool
+
+import pandas as pd
+
+from .cli import parse_curve_argument
+from .dates import to_ql_date
+from .curve_factory import CurveFactory, SharedCurves, curve_requests
+from .curve_store import CurveStore
+from .excel import read_excel
+from .files import format_path
+from .metrics import count_trades, get_run_metrics, reset_run_metrics, stage
+from .pricer import price_transactions
+from .trade_store import TradeStore
+from .sinks import SINKS, write_results
+from .validation import screen_trades, write_rejects
+
+
+def expand_dates(start=None, end=None, dates_file=None):
+    """
+    Build the list of evaluation dates from a business-day range and/or a date list file.
+
+    Parameters:
+    start (str): First date of the range (YYYY-MM-DD), inclusive.
+    end (str): Last date of the range (YYYY-MM-DD), inclusive.
+    dates_file (str): Text file with one date per line, e.g. the output of
+        notebooks/price/sample_random_days.ipynb.
+
+    Returns:
+    list: Sorted, de-duplicated pandas Timestamps.
+    """
+    dates = []
+    if start and end:
+        dates.extend(pd.bdate_range(start, end))
+    if dates_file:
+        with open(dates_file) as f:
+            dates.extend(pd.to_datetime(line.strip()) for line in f if line.strip())
+    return sorted({pd.Timestamp(d).normalize() for d in dates})
+
+
+def price_date(job):
+    """
+    Price one evaluation date. Runs inside a pool worker.
+
+    Parameters:
+    job (dict): 'date', 'transactions' (path template), 'curves' ({ccy: path template}),
+        'fixings_dir', 'backend', 'curve_store', 'shared_curves' and 'trade_store' (directories or None).
+
+    Returns:
+    tuple: (priced trades, rejected trades), both with an 'Evaluation Date' column, and the
+    worker's RunMetrics as a dict; or None if inputs are missing.
+    """
+    metrics = reset_run_metrics()
+    date = job['date']
+    transaction_file = format_path(job['transactions'], date)
+    if not os.path.exists(transaction_file):
+        logging.warning(f"No transaction file {transaction_file}; skipping {date:%Y-%m-%d}")
+        return None
+
+    yield_curves = {}
+    for currency, template in job['curves'].items():
+        curve_file = format_path(template, date, currency)
+        if os.path.exists(curve_file):
+            with stage('excel_read'):
+                yield_curves[currency] = read_excel(curve_file)
+        else:
+            logging.warning(f"No {currency} curve file {curve_file} for {date:%Y-%m-%d}")
+    if not yield_curves:
+        return None
+
+    try:
+        with stage('excel_read'):
+            transactions_df = read_excel(transaction_file)
+        transactions_data, rejects = screen_trades(transactions_df)
+        if job['shared_curves']:
+            curve_store = SharedCurves(job['shared_curves'])
+        else:
+            curve_store = CurveStore(job['curve_store']) if job['curve_store'] else None
+        trade_store = TradeStore(job['trade_store']) if job['trade_store'] else None
+        priced = price_transactions(transactions_data, yield_curves, to_ql_date(date), job['fixings_dir'],
+                                    job['backend'], curve_store=curve_store, trade_store=trade_store)
+    except Exception:
+        logging.exception(f"Failed to price {date:%Y-%m-%d}")
+        return None
+
+    count_trades(len(rejects), priced)
+    priced.insert(0, 'Evaluation Date', date)
+    rejects.insert(0, 'Evaluation Date', date)
+    return priced, rejects, metrics.to_dict()
+
+
+def run_batch(dates, transactions, curves, fixings_dir, backend='quantlib', processes=None, curve_store=None,
+              trade_store=None, shared_curves=None, warm_start=False, bootstrap_log=None):
+    """
+    Price many evaluation dates in a process pool.
+
+    Parameters:
+    dates (list): Evaluation dates.
+    transactions (str): Transaction file path template.
+    curves (dict): Curve file path templates keyed by currency.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    processes (int): Pool size; defaults to the number of CPUs.
+    curve_store (str): Optional directory of bootstrapped curves shared by the workers.
+    trade_store (str): Optional directory of priced trades shared by the workers.
+    shared_curves (str): Optional directory; if given, every curve is first bootstrapped by a
+        CurveFactory in the pool and the pricing workers attach to the published curves.
+    warm_start (bool): With shared_curves, warm-start each bootstrap from the previous date's curve.
+    bootstrap_log (str): With shared_curves, file to write the solve time of every bootstrapped curve to.
+
+    Returns:
+    tuple: (consolidated priced trades, consolidated rejects), ordered by evaluation date. The
+    workers' metrics are merged into this process's RunMetrics.
+    """
+    if shared_curves:
+        factory = CurveFactory(shared_curves, fixings_dir, processes, curve_store, warm_start)
+        factory.build(curve_requests(dates, curves))
+        if bootstrap_log:
+            write_results(factory.report(), bootstrap_log)
+
+    jobs = [{'date': date, 'transactions': transactions, 'curves': curves,
+             'fixings_dir': fixings_dir, 'backend': backend, 'curve_store': curve_store,
+             'shared_curves': shared_curves, 'trade_store': trade_store} for date in dates]
+
+    # maxtasksperchild=1 gives every date a fresh QuantLib global state (settings, fixings)
+    with Pool(processes=processes, maxtasksperchild=1) as pool:
+        results = [result for result in pool.imap(price_date, jobs) if result is not None]
+
+    if not results:
+        return pd.DataFrame(), pd.DataFrame()
+    priced, rejects, metrics = zip(*results)
+    for worker_metrics in metrics:
+        get_run_metrics().merge(worker_metrics)
+    return pd.concat(priced, ignore_index=True), pd.concat(rejects)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Price interest rate swaps for many evaluation dates in parallel')
+    parser.add_argument('output_file', help='Consolidated output file (.xlsx, .csv, .parquet or .feather)')
+    parser.add_argument('--transactions', required=True,
+                        help='Transaction file template, e.g. data/processed/USD/{date:%%Y-%%m-%%d}_output.xlsx')
+    parser.add_argument('--curve', type=parse_curve_argument, action='append', required=True,
+                        help='Curve file template per currency, as CCY=template, '
+                             'e.g. USD=data/raw/curves/USD/{ccy_lower}_{date:%%m%%d%%Y}.xlsx (repeatable)')
+    parser.add_argument('--start', help='First evaluation date (YYYY-MM-DD)')
+    parser.add_argument('--end', help='Last evaluation date (YYYY-MM-DD)')
+    parser.add_argument('--dates_file', help='File with one evaluation date per line')
+    parser.add_argument('--processes', type=int, default=None, help='Number of worker processes')
+    parser.add_argument('--fixings_dir', help='Directory with historical fixings workbooks',
+                        default='data/raw/historical_fixings')
+    parser.add_argument('--curve_store', default=None,
+                        help='Directory of bootstrapped curves reused across runs when the quotes are unchanged')
+    parser.add_argument('--trade_store', default=None,
+                        help='Directory of priced trades; only trades new since a run against the same curve are priced')
+    parser.add_argument('--shared_curves', default=None,
+                        help='Bootstrap all curves in parallel first and publish them to this directory as '
+                             'memory-mapped nodes shared by the pricing workers')
+    parser.add_argument('--warm_start', action='store_true',
+                        help="With --shared_curves, start each date's curve bootstrap from the previous date's curve")
+    parser.add_argument('--bootstrap_log', default=None,
+                        help='With --shared_curves, write the solve time of every bootstrapped curve to this file')
+    parser.add_argument('--backend', choices=['quantlib', 'vectorized'], default='quantlib',
+                        help='Pricing backend')
+    parser.add_argument('--output_format', choices=sorted(SINKS), default=None,
+                        help='Output format; inferred from the output file extension by default')
+    parser.add_argument('--rejects_file', default=None,
+                        help='Optional CSV listing unpriceable trades with a reason code')
+    parser.add_argument('--metrics_file', default=None,
+                        help='Write wall and CPU time per stage, trade counts and a pricing latency histogram, '
+                             'summed over all dates, to this JSON file')
+    parser.add_argument('--log_file', help='Optional log file', default=None)
+
+    args = parser.parse_args(argv)
+    if not args.dates_file and not (args.start and args.end):
+        parser.error('either --start and --end or --dates_file is required')
+    if (args.warm_start or args.bootstrap_log) and not args.shared_curves:
+        parser.error('--warm_start and --bootstrap_log require --shared_curves')
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    dates = expand_dates(args.start, args.end, args.dates_file)
+    priced_swaps_df, rejects = run_batch(dates, args.transactions, dict(args.curve), args.fixings_dir,
+                                         args.backend, args.processes, args.curve_store, args.trade_store,
+                                         args.shared_curves, args.warm_start, args.bootstrap_log)
+    with stage('output_write'):
+        write_results(priced_swaps_df, args.output_file, args.output_format)
+    if args.rejects_file:
+        write_rejects(rejects, args.rejects_file)
+    if args.metrics_file:
+        get_run_metrics().write(args.metrics_file)
+
+    if args.log_file:
+        with open(args.log_file, 'a') as log_file:
+            log_file.write(f"Successfully processed {len(dates)} evaluation dates and saved output to "
+                           f"{args.output_file}\n")
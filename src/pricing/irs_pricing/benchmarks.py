@@ -0,0 +1,172 @@
+# Name: benchmarks.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Pricing throughput benchmarks on synthetic inputs. Every (trade count, backend)
+# run generates its curves and trades with the synthetic module in a fresh process, so that
+# the peak resident set size reported is that of the run alone, and reports bootstrap time,
+# pricing time and swaps per second.
+
+import argparse
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from .conventions import get_convention
+from .curves import bootstrap_curve
+from .dates import to_ql_date
+from .pricer import currency_index, get_pricer_class, set_evaluation_date
+from .sinks import write_results
+from .synthetic import CURRENCY_WEIGHTS, synthetic_curve, synthetic_trades
+from .validation import screen_trades
+
+SIZES = (1_000, 100_000, 1_000_000)
+BACKENDS = ('vectorized', 'quantlib')
+EVALUATION_DATE = '2013-03-11'
+
+
+def peak_rss_mb():
+    """
+    Peak resident set size of the current process in MB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def run_benchmark(job):
+    """
+    Generate the inputs of one run, bootstrap every currency's curve and price the trades.
+    Runs in its own process; see benchmark_pricing.
+
+    Parameters:
+    job (dict): 'trades', 'backend', 'evaluation_date' (YYYY-MM-DD), 'currencies', 'seed' and
+        'fixings_dir'.
+
+    Returns:
+    dict: One report row.
+    """
+    # Runs without fixings would otherwise warn once per currency
+    logging.getLogger().setLevel(logging.ERROR)
+    evaluation_date = to_ql_date(job['evaluation_date'])
+
+    start = time.perf_counter()
+    transactions_df = synthetic_trades(job['trades'], job['evaluation_date'], job['currencies'], job['seed'])
+    transactions_df, _ = screen_trades(transactions_df)
+    generate_seconds = time.perf_counter() - start
+
+    bootstrap_seconds = pricing_seconds = 0.0
+    priced = 0
+    for currency, group in transactions_df.groupby('Curr'):
+        convention = get_convention(currency)
+        yield_curve_df = synthetic_curve(currency, job['evaluation_date'], job['seed'])
+
+        start = time.perf_counter()
+        currency_date = set_evaluation_date(evaluation_date, convention)
+        index, handle = currency_index(convention, job['fixings_dir'], currency_date)
+        yield_curve = bootstrap_curve(yield_curve_df, convention, currency_date)
+        handle.linkTo(yield_curve)
+        bootstrap_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        fair_rate, _ = get_pricer_class(job['backend'])(yield_curve, index, convention).price_arrays(group)
+        pricing_seconds += time.perf_counter() - start
+        priced += int((~pd.isna(fair_rate)).sum())
+
+    return {'Trades': job['trades'],
+            'Backend': job['backend'],
+            'Generate s': generate_seconds,
+            'Bootstrap ms': bootstrap_seconds * 1000,
+            'Pricing s': pricing_seconds,
+            'Swaps/sec': len(transactions_df) / pricing_seconds if pricing_seconds else float('nan'),
+            'Priced': priced,
+            'Peak RSS MB': peak_rss_mb()}
+
+
+def benchmark_pricing(sizes=SIZES, backends=BACKENDS, evaluation_date=EVALUATION_DATE, currencies=None, seed=0,
+                      fixings_dir=None):
+    """
+    Benchmark pricing throughput at several portfolio sizes.
+
+    Each (size, backend) pair runs in a freshly spawned process. Trades are generated on the
+    evaluation date across the currencies, and curves are bootstrapped without historical
+    fixings unless a fixings directory is given.
+
+    Parameters:
+    sizes (iterable): Trade counts.
+    backends (iterable): Pricing backends; see get_pricer_class.
+    evaluation_date (str): Evaluation date, YYYY-MM-DD.
+    currencies (list): Currencies of the trades; all supported currencies by default.
+    seed (int): Seed of the synthetic inputs.
+    fixings_dir (str): Optional directory of historical fixings workbooks.
+
+    Returns:
+    pandas.DataFrame: One row per run with 'Trades', 'Backend', 'Generate s', 'Bootstrap ms',
+    'Pricing s', 'Swaps/sec', 'Priced' and 'Peak RSS MB'.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as empty_dir:
+        for trades in sizes:
+            for backend in backends:
+                job = {'trades': int(trades), 'backend': backend, 'evaluation_date': evaluation_date,
+                       'currencies': currencies, 'seed': seed, 'fixings_dir': fixings_dir or empty_dir}
+                with multiprocessing.get_context('spawn').Pool(1) as pool:
+                    rows.append(pool.apply(run_benchmark, (job,)))
+                logging.info(f"{trades} trades, {backend}: {rows[-1]['Swaps/sec']:.0f} swaps/sec")
+    return pd.DataFrame(rows)
+
+
+def save_inputs(directory, trades, evaluation_date=EVALUATION_DATE, currencies=None, seed=0):
+    """
+    Write a run's synthetic curve sheets and transaction sheet, for use with price_swaps.py.
+
+    The files are {CCY}_curve.xlsx for each currency and trades_{trades}.xlsx.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for currency in currencies or CURRENCY_WEIGHTS:
+        synthetic_curve(currency, evaluation_date, seed).to_excel(
+            os.path.join(directory, f"{currency}_curve.xlsx"), index=False)
+    synthetic_trades(trades, evaluation_date, currencies, seed).to_excel(
+        os.path.join(directory, f"trades_{trades}.xlsx"), index=False)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark swap pricing throughput on synthetic curves and trades')
+    parser.add_argument('--trades', type=int, action='append', default=None,
+                        help='Trade count to benchmark (repeatable); 1k, 100k and 1M by default')
+    parser.add_argument('--backend', choices=BACKENDS, action='append', default=None,
+                        help='Pricing backend to benchmark (repeatable); both by default')
+    parser.add_argument('--evaluation_date', default=EVALUATION_DATE, help='Evaluation date (in format YYYY-MM-DD)')
+    parser.add_argument('--currency', action='append', default=None,
+                        help='Currency of the trades (repeatable); all supported currencies by default')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic inputs')
+    parser.add_argument('--fixings_dir', default=None,
+                        help='Directory with historical fixings workbooks; none are used by default')
+    parser.add_argument('--save_inputs', default=None,
+                        help='Also write the curve and transaction sheets of each size to this directory')
+    parser.add_argument('--output_file', default=None, help='Also write the report to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    sizes = args.trades or SIZES
+    if args.save_inputs:
+        for trades in sizes:
+            save_inputs(args.save_inputs, trades, args.evaluation_date, args.currency, args.seed)
+
+    report = benchmark_pricing(sizes, args.backend or BACKENDS, args.evaluation_date, args.currency, args.seed,
+                               args.fixings_dir)
+    print(report.to_string(index=False))
+    if args.output_file:
+        write_results(report, args.output_file)
+
+
+if __name__ == "__main__":
+    main()
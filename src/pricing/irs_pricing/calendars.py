@@ -0,0 +1,237 @@
+# Name: calendars.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Precomputed business-day tables for QuantLib calendars. Each calendar's
+# holidays and weekends are listed once over a year range; date adjustment, business-day advancing and
+# Forward/Backward schedule generation then run as array operations on whole columns of
+# ql.Date serial numbers, reproducing ql.Calendar and ql.Schedule.
+
+import numpy as np
+import QuantLib as ql
+
+from .dates import serials_to_ymd, ymd_to_serials
+
+FIRST_YEAR = 1970
+LAST_YEAR = 2100
+
+
+def add_months(serials, months):
+    """
+    Add calendar months to date serials, clipping the day to the end of the target month
+    (as ql.Date + ql.Period does).
+    """
+    years, month, days = serials_to_ymd(serials)
+    total = years * 12 + month - 1 + np.asarray(months, dtype=np.int64)
+    years, month = total // 12, total % 12 + 1
+    return ymd_to_serials(years, month, np.minimum(days, days_in_month(years, month)))
+
+
+def days_in_month(years, months):
+    first = ymd_to_serials(years, months, 1)
+    return add_month_starts(years, months) - first
+
+
+def add_month_starts(years, months):
+    """
+    Serial of the first day of the month following (years, months).
+    """
+    total = np.asarray(years, dtype=np.int64) * 12 + np.asarray(months, dtype=np.int64)
+    return ymd_to_serials(total // 12, total % 12 + 1, 1)
+
+
+def month_ends(serials):
+    """
+    Last calendar day of each date's month (ql.Date.endOfMonth).
+    """
+    years, months, _ = serials_to_ymd(serials)
+    return add_month_starts(years, months) - 1
+
+
+class BusinessDayTable:
+    """
+    Business-day bitmap and next/previous business day positions of one calendar.
+
+    Parameters:
+    calendar (ql.Calendar): The calendar to tabulate.
+    first_year (int): First year covered.
+    last_year (int): Last year covered.
+    """
+
+    def __init__(self, calendar, first_year=FIRST_YEAR, last_year=LAST_YEAR):
+        self.calendar = calendar
+        self.name = calendar.name()
+        self.first = ql.Date(1, 1, first_year).serialNumber()
+        self.last = ql.Date(31, 12, last_year).serialNumber()
+        serials = np.arange(self.first, self.last + 1)
+        holidays = [d.serialNumber() for d in calendar.holidayList(ql.Date(self.first), ql.Date(self.last), True)]
+        self.is_business = np.ones(len(serials), dtype=bool)
+        self.is_business[np.asarray(holidays, dtype=np.int64) - self.first] = False
+        self.business_days = serials[self.is_business]
+        # Position in business_days of the first business day on or after, and the last on or before, each day
+        self._following = np.searchsorted(self.business_days, serials, side='left')
+        self._preceding = np.searchsorted(self.business_days, serials, side='right') - 1
+
+    def _offsets(self, serials):
+        serials = np.asarray(serials, dtype=np.int64)
+        if serials.size and (serials.min() < self.first or serials.max() > self.last):
+            raise ValueError(f"Dates outside the {self.name} business-day table "
+                             f"({ql.Date(self.first).ISO()} to {ql.Date(self.last).ISO()})")
+        return serials - self.first
+
+    def covers(self, serials):
+        """
+        True if every date (plus a month of margin either side) is inside the table.
+        """
+        serials = np.asarray(serials, dtype=float)
+        serials = serials[~np.isnan(serials)]
+        return not serials.size or (serials.min() - 31 >= self.first and serials.max() + 31 <= self.last)
+
+    def is_business_day(self, serials):
+        return self.is_business[self._offsets(serials)]
+
+    def adjust(self, serials, convention=ql.Following):
+        """
+        Vectorized ql.Calendar.adjust for Following, ModifiedFollowing, Preceding,
+        ModifiedPreceding and Unadjusted.
+        """
+        serials = np.asarray(serials, dtype=np.int64)
+        if convention == ql.Unadjusted:
+            return serials.copy()
+        offsets = self._offsets(serials)
+        following = self.business_days[self._following[offsets]]
+        preceding = self.business_days[self._preceding[offsets]]
+        if convention == ql.Following:
+            return following
+        if convention == ql.Preceding:
+            return preceding
+        months = serials_to_ymd(serials)[1]
+        if convention == ql.ModifiedFollowing:
+            return np.where(serials_to_ymd(following)[1] != months, preceding, following)
+        if convention == ql.ModifiedPreceding:
+            return np.where(serials_to_ymd(preceding)[1] != months, following, preceding)
+        raise ValueError(f"Unsupported business day convention {convention}")
+
+    def advance_days(self, serials, days):
+        """
+        Vectorized ql.Calendar.advance by a number of business days.
+        """
+        serials = np.asarray(serials, dtype=np.int64)
+        days = np.broadcast_to(np.asarray(days, dtype=np.int64), serials.shape)
+        offsets = self._offsets(serials)
+        forward = self._preceding[offsets] + days
+        backward = self._following[offsets] + days
+        positions = np.where(days > 0, forward, backward)
+        result = self.business_days[np.clip(positions, 0, len(self.business_days) - 1)]
+        if ((positions < 0) | (positions >= len(self.business_days))).any():
+            raise ValueError(f"Advanced dates fall outside the {self.name} business-day table")
+        return np.where(days == 0, self.adjust(serials, ql.Following), result)
+
+    def end_of_month(self, serials):
+        """
+        Last business day of each date's month (ql.Calendar.endOfMonth).
+        """
+        return self.adjust(month_ends(serials), ql.Preceding)
+
+    def is_end_of_month(self, serials):
+        """
+        Vectorized ql.Calendar.isEndOfMonth: the next business day is in another month.
+        """
+        serials = np.asarray(serials, dtype=np.int64)
+        return serials_to_ymd(self.adjust(serials + 1, ql.Following))[1] != serials_to_ymd(serials)[1]
+
+    def advance_months(self, serials, months, convention=ql.Following, end_of_month=False):
+        """
+        Vectorized ql.Calendar.advance by a number of months.
+        """
+        serials = np.asarray(serials, dtype=np.int64)
+        moved = add_months(serials, months)
+        adjusted = self.adjust(moved, convention)
+        if end_of_month:
+            adjusted = np.where(self.is_end_of_month(serials), self.end_of_month(moved), adjusted)
+        return adjusted
+
+    def schedules(self, effective, maturity, months, convention=ql.ModifiedFollowing,
+                  rule=ql.DateGeneration.Backward, end_of_month=False):
+        """
+        Generate ql.Schedule dates for many trades at once.
+
+        The same convention is used for the accrual and termination dates, as in ScheduleCache;
+        only the Forward and Backward rules without stub dates are supported.
+
+        Parameters:
+        effective (numpy.ndarray): Effective date serials.
+        maturity (numpy.ndarray): Maturity date serials, after the effective dates.
+        months (int): Coupon tenor in months.
+        convention (int): Business day convention.
+        rule (int): ql.DateGeneration.Forward or ql.DateGeneration.Backward.
+        end_of_month (bool): End-of-month flag.
+
+        Returns:
+        numpy.ndarray: (trades, max dates) array of schedule date serials, padded with NaN.
+        """
+        effective = np.asarray(effective, dtype=np.int64)
+        maturity = np.asarray(maturity, dtype=np.int64)
+        n = len(effective)
+        if n == 0:
+            return np.empty((0, 2))
+        if rule not in (ql.DateGeneration.Backward, ql.DateGeneration.Forward):
+            raise ValueError(f"Unsupported date generation rule {rule}")
+        backward = rule == ql.DateGeneration.Backward
+        seed, exit_date = (maturity, effective) if backward else (effective, maturity)
+
+        # Unadjusted dates stepped from the seed, as ql.NullCalendar().advance(seed, i * tenor, ...)
+        span = (maturity - effective).max() / 28 + 1
+        steps = np.arange(int(span // months) + 2)
+        moved = add_months(seed[:, None], (-steps if backward else steps)[None, :] * months)
+        if end_of_month:
+            moved = np.where((month_ends(seed) == seed)[:, None], month_ends(moved), moved)
+        inside = moved >= exit_date[:, None] if backward else moved <= exit_date[:, None]
+        count = inside.sum(axis=1)
+        last = moved[np.arange(n), count - 1]
+        # The exit date is only added when it does not adjust onto the last generated date
+        closing = self.adjust(last, convention) != self.adjust(exit_date, convention)
+        length = count + closing
+
+        # Lay the dates out in ascending order, closing with the exit date where needed
+        width = length.max()
+        position = np.arange(width)[None, :]
+        if backward:
+            step = count[:, None] - 1 - (position - closing[:, None])
+            dates = np.where(closing[:, None] & (position == 0), exit_date[:, None],
+                             np.take_along_axis(moved, np.clip(step, 0, moved.shape[1] - 1), axis=1))
+        else:
+            dates = np.where(closing[:, None] & (position == count[:, None]), exit_date[:, None],
+                             np.take_along_axis(moved, np.clip(position, 0, moved.shape[1] - 1), axis=1))
+        used = position < length[:, None]
+        dates = np.where(used, dates, dates[:, :1])
+
+        # With the end-of-month flag and a seed on a business month end, interior dates move to month end
+        if end_of_month:
+            interior = (position > 0) & (position < length[:, None] - 1) & self.is_end_of_month(seed)[:, None]
+            dates = np.where(interior, month_ends(dates), dates)
+        adjusted = self.adjust(dates, convention)
+        rows = np.arange(n)
+
+        # Drop a next-to-last date on or after the last one, then a second date on or before the first
+        adjusted = np.where(used, adjusted, np.nan).astype(float)
+        tail = (length >= 2) & (adjusted[rows, np.maximum(length - 2, 0)] >= adjusted[rows, length - 1])
+        adjusted[rows[tail], length[tail] - 2] = adjusted[rows[tail], length[tail] - 1]
+        adjusted[rows[tail], length[tail] - 1] = np.nan
+        length = length - tail
+        head = (length >= 2) & (adjusted[:, 1] <= adjusted[:, 0])
+        adjusted[head, 1:] = np.concatenate([adjusted[head, 2:], np.full((head.sum(), 1), np.nan)], axis=1)
+        length = length - head
+        return adjusted[:, :length.max()]
+
+
+_tables = {}
+
+
+def get_business_day_table(calendar, first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """
+    Return the process-wide BusinessDayTable of a calendar, building it on first use.
+    """
+    key = (calendar.name(), first_year, last_year)
+    if key not in _tables:
+        _tables[key] = BusinessDayTable(calendar, first_year, last_year)
+    return _tables[key]
@@ -0,0 +1,225 @@
+# Name: cli.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Command line entry point for the multi-currency swap pricer.
+
+import argparse
+import logging
+import os
+
+import QuantLib as ql
+
+from .conventions import CONVENTIONS
+from .curve_factory import CurveFactory, curve_requests
+from .curve_store import CurveStore
+from .curves import CurveCache, curve_file_loader
+from .dates import parse_trade_dates, to_ql_date
+from .excel import read_excel
+from .metrics import count_trades, get_run_metrics, stage
+from .pricer import price_by_trade_date, price_transactions
+from .risk import portfolio_dv01
+from .scenarios import price_scenarios, read_scenarios, stack_scenarios
+from .sinks import SINKS, sink_format, write_results
+from .streaming import CHUNKED_EXTENSIONS, follow_stream, price_stream
+from .trade_store import TradeStore
+from .validation import screen_trades, summarize_rejects, write_rejects
+
+
+def parse_curve_argument(value):
+    currency, sep, path = value.partition('=')
+    if not sep or not path:
+        raise argparse.ArgumentTypeError(f"Expected CCY=path, got '{value}'")
+    currency = currency.upper()
+    if currency not in CONVENTIONS:
+        raise argparse.ArgumentTypeError(f"Unsupported currency '{currency}'")
+    return currency, path
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Price interest rate swaps using QuantLib')
+    parser.add_argument('transaction_file', help='Transaction data Excel file (may mix currencies)')
+    parser.add_argument('output_file', help='Output file (.xlsx, .csv, .parquet or .feather)')
+    parser.add_argument('evaluation_date', nargs='?', default=None,
+                        help='Evaluation date (in format YYYY-MM-DD); omit with --by_trade_date')
+    parser.add_argument('--curve', help='Yield curve Excel file for a currency, as CCY=path (repeatable). '
+                        'With --by_trade_date, a path template such as USD=curves/usd_{date:%%m%%d%%Y}.xlsx',
+                        type=parse_curve_argument, action='append', required=True)
+    parser.add_argument('--by_trade_date', action='store_true',
+                        help="Price each trade against the curve of its 'Trade Time' date")
+    parser.add_argument('--curve_cache_size', type=int, default=64,
+                        help='Number of bootstrapped curves kept in memory with --by_trade_date')
+    parser.add_argument('--fixings_dir', help='Directory with historical fixings workbooks',
+                        default='data/raw/historical_fixings')
+    parser.add_argument('--curve_store', default=None,
+                        help='Directory of bootstrapped curves reused across runs when the quotes are unchanged')
+    parser.add_argument('--trade_store', default=None,
+                        help='Directory of priced trades; only trades new since a run against the same curve are priced')
+    parser.add_argument('--shared_curves', default=None,
+                        help='With --by_trade_date, bootstrap every curve in a process pool first and publish them '
+                             'to this directory as memory-mapped nodes')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='Number of bootstrapping processes for --shared_curves')
+    parser.add_argument('--warm_start', action='store_true',
+                        help="With --by_trade_date, start each date's curve bootstrap from the previous date's curve")
+    parser.add_argument('--bootstrap_log', default=None,
+                        help='With --by_trade_date, write the solve time of every bootstrapped curve to this file')
+    parser.add_argument('--backend', help='Pricing backend: QuantLib swap objects or vectorized NumPy',
+                        choices=['quantlib', 'vectorized'], default='quantlib')
+    parser.add_argument('--cross_check', help='With --backend vectorized and a single evaluation date, re-price this '
+                        'many trades per currency through QuantLib and log the maximum deviation',
+                        type=int, default=0)
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='Stream a CSV or Parquet transaction file in chunks of this many trades, '
+                             'appending each priced chunk to a CSV, Parquet or Feather output')
+    parser.add_argument('--follow', action='store_true',
+                        help='Tail an append-only CSV or JSONL transaction file and price trades as they are appended; '
+                             'curve files are reloaded when they change. The evaluation date defaults to today')
+    parser.add_argument('--poll_interval', type=float, default=1.0,
+                        help='With --follow, seconds between checks for new trades')
+    parser.add_argument('--idle_timeout', type=float, default=None,
+                        help='With --follow, stop after this many seconds without new trades')
+    parser.add_argument('--new_only', action='store_true',
+                        help='With --follow, skip the trades already in the file when it is opened')
+    parser.add_argument('--dv01_file', default=None,
+                        help='Also write bucketed fair rate and PV sensitivities to each curve quote to this file')
+    parser.add_argument('--dv01_bump', type=float, default=1.0, help='Curve quote bump in bps for --dv01_file')
+    parser.add_argument('--scenarios', default=None,
+                        help="CSV of curve shocks: a 'Scenario' column and one column of zero-rate bps per pillar tenor")
+    parser.add_argument('--scenario_file', default=None,
+                        help='Write the fair rate and Difference of every trade under every scenario to this file')
+    parser.add_argument('--output_format', choices=sorted(SINKS), default=None,
+                        help='Output format; inferred from the output file extension by default')
+    parser.add_argument('--rejects_file', default=None,
+                        help='Optional CSV listing unpriceable trades with a reason code')
+    parser.add_argument('--metrics_file', default=None,
+                        help='Write wall and CPU time per stage, trade counts and a pricing latency histogram '
+                             'to this JSON file')
+    parser.add_argument('--log_file', help='Optional log file', default=None)
+
+    args = parser.parse_args(argv)
+    if args.evaluation_date is None and not (args.by_trade_date or args.follow):
+        parser.error('evaluation_date is required unless --by_trade_date or --follow is given')
+    if args.follow and (args.by_trade_date or args.chunksize is not None or args.dv01_file is not None
+                        or args.scenarios is not None or args.trade_store is not None):
+        parser.error('--follow cannot be combined with --by_trade_date, --chunksize, --dv01_file, --scenarios '
+                     'or --trade_store')
+    if (args.idle_timeout is not None or args.new_only) and not args.follow:
+        parser.error('--idle_timeout and --new_only are only supported with --follow')
+    if args.chunksize is not None and args.by_trade_date:
+        parser.error('--chunksize cannot be combined with --by_trade_date')
+    if args.chunksize is not None:
+        if os.path.splitext(args.transaction_file)[1].lower() not in CHUNKED_EXTENSIONS:
+            parser.error('--chunksize needs a CSV or Parquet transaction file')
+        try:
+            output_format = sink_format(args.output_file, args.output_format)
+        except ValueError as e:
+            parser.error(str(e))
+        if not SINKS[output_format].incremental:
+            parser.error(f"--chunksize cannot write {output_format} output, which is only written once complete; "
+                         f"use {', '.join(name for name, sink in sorted(SINKS.items()) if sink.incremental)}")
+    if args.dv01_file is not None and (args.by_trade_date or args.chunksize is not None):
+        parser.error('--dv01_file is only supported with a single evaluation date')
+    if (args.scenarios is None) != (args.scenario_file is None):
+        parser.error('--scenarios and --scenario_file must be given together')
+    if args.scenarios is not None and (args.by_trade_date or args.chunksize is not None):
+        parser.error('--scenarios is only supported with a single evaluation date')
+    if args.trade_store is not None and (args.by_trade_date or args.chunksize is not None):
+        parser.error('--trade_store is only supported with a single evaluation date')
+    if args.cross_check < 0:
+        parser.error('--cross_check must not be negative')
+    if args.cross_check and args.backend != 'vectorized':
+        parser.error('--cross_check is only supported with --backend vectorized')
+    if args.cross_check and (args.by_trade_date or args.chunksize is not None or args.follow):
+        parser.error('--cross_check is only supported with a single evaluation date')
+    if (args.shared_curves is not None or args.warm_start or args.bootstrap_log is not None) and not args.by_trade_date:
+        parser.error('--shared_curves, --warm_start and --bootstrap_log are only supported with --by_trade_date')
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    if args.chunksize is not None:
+        return stream(args)
+    if args.follow:
+        return follow(args)
+
+    with stage('excel_read'):
+        transactions_df = read_excel(args.transaction_file)
+    transactions_data, rejects = screen_trades(transactions_df)
+    if len(rejects):
+        logging.warning(f"Rejected {len(rejects)} trades before pricing: {summarize_rejects(rejects)}")
+    if args.rejects_file:
+        write_rejects(rejects, args.rejects_file)
+    curve_store = CurveStore(args.curve_store) if args.curve_store else None
+    trade_store = TradeStore(args.trade_store) if args.trade_store else None
+
+    if args.by_trade_date:
+        if args.shared_curves:
+            # Undated and unsupported trades are skipped and reported by price_by_trade_date
+            trade_dates = parse_trade_dates(transactions_data['Trade Time'])
+            priceable = trade_dates.notna() & transactions_data['Curr'].isin(CONVENTIONS)
+            groups = sorted(set(zip(trade_dates[priceable], transactions_data['Curr'][priceable])))
+            factory = CurveFactory(args.shared_curves, args.fixings_dir, args.processes, args.curve_store,
+                                   args.warm_start)
+            curve_store = factory.build(curve_requests(groups, dict(args.curve), roll=True))
+        curve_cache = CurveCache(curve_file_loader(dict(args.curve)), maxsize=args.curve_cache_size,
+                                 curve_store=curve_store, warm_start=args.warm_start)
+        priced_swaps_df = price_by_trade_date(transactions_data, curve_cache, args.fixings_dir, args.backend)
+        if args.bootstrap_log:
+            write_results(factory.report() if args.shared_curves else curve_cache.bootstrap_report(),
+                          args.bootstrap_log)
+    else:
+        with stage('excel_read'):
+            yield_curves = {currency: read_excel(path) for currency, path in args.curve}
+        evaluation_date = to_ql_date(args.evaluation_date)
+        priced_swaps_df = price_transactions(transactions_data, yield_curves, evaluation_date, args.fixings_dir,
+                                             args.backend, args.cross_check, curve_store, trade_store)
+        if args.dv01_file:
+            dv01 = portfolio_dv01(transactions_data, yield_curves, evaluation_date, args.fixings_dir, args.dv01_bump)
+            write_results(dv01, args.dv01_file)
+        if args.scenarios:
+            fair_rate, difference = price_scenarios(transactions_data, yield_curves, evaluation_date,
+                                                    args.fixings_dir, read_scenarios(args.scenarios), curve_store)
+            write_results(stack_scenarios(transactions_data, fair_rate, difference), args.scenario_file)
+    with stage('output_write'):
+        write_results(priced_swaps_df, args.output_file, args.output_format)
+
+    count_trades(len(rejects), priced_swaps_df)
+    if args.metrics_file:
+        get_run_metrics().write(args.metrics_file)
+    if args.log_file:
+        with open(args.log_file, 'a') as log_file:
+            log_file.write(f"Successfully processed swaps and saved output to {args.output_file}\n")
+
+
+def stream(args):
+    curve_store = CurveStore(args.curve_store) if args.curve_store else None
+    with stage('excel_read'):
+        yield_curves = {currency: read_excel(path) for currency, path in args.curve}
+    read, priced, rejected = price_stream(args.transaction_file, args.output_file, yield_curves,
+                                          to_ql_date(args.evaluation_date), args.fixings_dir, args.chunksize,
+                                          args.backend, args.output_format, args.rejects_file, curve_store)
+    if rejected:
+        logging.warning(f"Rejected {rejected} trades before pricing")
+
+    if args.metrics_file:
+        get_run_metrics().write(args.metrics_file)
+    if args.log_file:
+        with open(args.log_file, 'a') as log_file:
+            log_file.write(f"Successfully streamed {priced} of {read} swaps and saved output to {args.output_file}\n")
+
+
+def follow(args):
+    evaluation_date = to_ql_date(args.evaluation_date) if args.evaluation_date else ql.Date.todaysDate()
+    read, priced, rejected = follow_stream(args.transaction_file, args.output_file, dict(args.curve), evaluation_date,
+                                           args.fixings_dir, args.backend, args.output_format, args.rejects_file,
+                                           args.poll_interval, args.idle_timeout, not args.new_only)
+    if rejected:
+        logging.warning(f"Rejected {rejected} trades before pricing")
+
+    if args.metrics_file:
+        get_run_metrics().write(args.metrics_file)
+    if args.log_file:
+        with open(args.log_file, 'a') as log_file:
+            log_file.write(f"Successfully followed {priced} of {read} swaps and saved output to {args.output_file}\n")
@@ -0,0 +1,163 @@
+# Name: conventions.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Per-currency market conventions used to build curves and price swaps.
+# Each entry replaces the hard-coded settings in the old price_swaps_<ccy>.py scripts.
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import QuantLib as ql
+
+
+@dataclass(frozen=True)
+class HelperRule:
+    """
+    Maps a curve quote row to a QuantLib rate helper.
+
+    Parameters:
+    column (str): The quote sheet column searched for the pattern (usually 'Description').
+    pattern (str): Substring identifying the instrument, e.g. 'USSWAP'.
+    kind (str): One of 'deposit', 'futures', 'fra' or 'swap'.
+    settlement_days (int): Settlement/fixing days for deposits and FRAs.
+    frequency (int): Fixed leg frequency for swap helpers.
+    convention (int): Fixed leg business day convention for swap helpers.
+    day_counter (ql.DayCounter): Day counter of the quoted instrument.
+    index (callable): Builds the floating index for futures (from the row tenor) or swaps.
+    """
+    column: str
+    pattern: str
+    kind: str
+    settlement_days: int = 2
+    frequency: int = ql.Annual
+    convention: int = ql.Unadjusted
+    day_counter: Optional[ql.DayCounter] = None
+    index: Optional[Callable] = None
+
+
+@dataclass(frozen=True)
+class CurrencyConvention:
+    """
+    Market conventions for one currency.
+
+    Parameters:
+    currency (str): ISO currency code as it appears in the 'Curr' column.
+    calendar (ql.Calendar): Calendar for helpers and swap schedules.
+    helper_rules (tuple): Ordered HelperRule entries; the first matching rule wins.
+    index (callable): Builds the floating index from a yield term structure handle.
+    fixed_day_counter (ql.DayCounter): Day counter of the fixed leg.
+    schedule_rule (int): ql.DateGeneration rule for both legs.
+    end_of_month (bool): End-of-month flag for both legs.
+    evaluation_calendar (ql.Calendar): Calendar used to roll the evaluation date, or None.
+    fixings_file (str): Historical fixings workbook name, or None if no fixings are loaded.
+    fixings_column (str): Column of the fixings workbook holding the fixing in percent.
+    """
+    currency: str
+    calendar: ql.Calendar
+    helper_rules: Tuple[HelperRule, ...]
+    index: Callable
+    fixed_day_counter: ql.DayCounter
+    schedule_rule: int = ql.DateGeneration.Backward
+    end_of_month: bool = True
+    evaluation_calendar: Optional[ql.Calendar] = None
+    fixings_file: Optional[str] = None
+    fixings_column: str = 'PX_ASK'
+
+
+CONVENTIONS = {
+    'USD': CurrencyConvention(
+        currency='USD',
+        calendar=ql.UnitedStates(ql.UnitedStates.Settlement),
+        helper_rules=(
+            HelperRule('Description', 'US000', 'deposit', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('Description', 'ED', 'futures', index=lambda tenor: ql.USDLibor(tenor)),
+            HelperRule('Description', 'USSWAP', 'swap', frequency=ql.Annual, convention=ql.Unadjusted,
+                       day_counter=ql.Thirty360(ql.Thirty360.BondBasis),
+                       index=lambda: ql.USDLibor(ql.Period('3M'))),
+        ),
+        index=lambda handle: ql.USDLibor(ql.Period('3M'), handle),
+        fixed_day_counter=ql.Thirty360(ql.Thirty360.BondBasis),
+        evaluation_calendar=ql.UnitedKingdom(),
+        fixings_file='USD_LIBOR_fixings.xlsx',
+        fixings_column='PX_ASK',
+    ),
+    'CAD': CurrencyConvention(
+        currency='CAD',
+        calendar=ql.Canada(),
+        helper_rules=(
+            HelperRule('Description', 'CCLR', 'deposit', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('Description', 'CDOR', 'deposit', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('Description', 'BA', 'futures', index=lambda tenor: ql.Cdor(tenor)),
+            HelperRule('Description', 'CDSW', 'swap', frequency=ql.Semiannual, convention=ql.Unadjusted,
+                       day_counter=ql.Thirty360(ql.Thirty360.BondBasis),
+                       index=lambda: ql.Cdor(ql.Period('3M'))),
+        ),
+        index=lambda handle: ql.Cdor(ql.Period('3M'), handle),
+        fixed_day_counter=ql.Actual365Fixed(ql.Actual365Fixed.Canadian),
+        evaluation_calendar=ql.Canada(),
+        fixings_file='CDOR_fixings.xlsx',
+        fixings_column='PX_LAST',
+    ),
+    'EUR': CurrencyConvention(
+        currency='EUR',
+        calendar=ql.TARGET(),
+        helper_rules=(
+            HelperRule('Description', 'Index', 'deposit', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('Description', 'EUFR', 'fra', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('CUSIP', 'EUSA', 'swap', frequency=ql.Annual, convention=ql.Unadjusted,
+                       day_counter=ql.Thirty360(ql.Thirty360.European),
+                       index=lambda: ql.Euribor6M()),
+        ),
+        index=lambda handle: ql.Euribor3M(handle),
+        fixed_day_counter=ql.Thirty360(ql.Thirty360.European),
+        schedule_rule=ql.DateGeneration.Forward,
+        end_of_month=False,
+    ),
+    'GBP': CurrencyConvention(
+        currency='GBP',
+        calendar=ql.UnitedKingdom(),
+        helper_rules=(
+            HelperRule('Description', 'BP000', 'deposit', settlement_days=2, day_counter=ql.Actual360()),
+            HelperRule('Description', 'BPSW', 'swap', frequency=ql.Semiannual, convention=ql.ModifiedFollowing,
+                       day_counter=ql.Actual365Fixed(),
+                       index=lambda: ql.GBPLibor(ql.Period('6M'))),
+        ),
+        index=lambda handle: ql.GBPLibor(ql.Period('6M'), handle),
+        fixed_day_counter=ql.Actual365Fixed(),
+        evaluation_calendar=ql.UnitedKingdom(),
+        fixings_file='GBP_historical_fixings.xlsx',
+        fixings_column='PX_ASK',
+    ),
+    'CHF': CurrencyConvention(
+        currency='CHF',
+        calendar=ql.Switzerland(),
+        helper_rules=(
+            HelperRule('Description', 'SFDR', 'deposit', settlement_days=0, day_counter=ql.Actual360()),
+            HelperRule('Description', 'ES', 'futures', index=lambda tenor: ql.CHFLibor(tenor)),
+            HelperRule('Description', 'SFSW', 'swap', frequency=ql.Annual, convention=ql.Unadjusted,
+                       day_counter=ql.Thirty360(ql.Thirty360.European),
+                       index=lambda: ql.CHFLibor(ql.Period('6M'))),
+        ),
+        index=lambda handle: ql.CHFLibor(ql.Period('6M'), handle),
+        fixed_day_counter=ql.Thirty360(ql.Thirty360.European),
+        evaluation_calendar=ql.UnitedKingdom(),
+        fixings_file='CHF_historical_fixings.xlsx',
+        fixings_column='PX_ASK',
+    ),
+}
+
+
+def get_convention(currency):
+    """
+    Look up the conventions for a currency.
+
+    Parameters:
+    currency (str): ISO currency code.
+
+    Returns:
+    CurrencyConvention: The registered conventions.
+    """
+    try:
+        return CONVENTIONS[currency.upper()]
+    except KeyError:
+        raise ValueError(f"No pricing conventions registered for currency '{currency}'")
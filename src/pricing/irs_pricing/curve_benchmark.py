@@ -0,0 +1,125 @@
+# Name: curve_benchmark.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Benchmark of curve construction methods. Each curve type in CURVE_TYPES is
+# bootstrapped from the same quote sheet and used to price the same trades; bootstrap time,
+# pricing time per trade and the change of 'Difference' against the production flat-forward
+# curve are reported side by side.
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from .cli import parse_curve_argument
+from .conventions import get_convention
+from .curves import CURVE_TYPES, build_helpers, build_yield_curve
+from .dates import to_ql_date
+from .excel import read_excel
+from .pricer import SwapPricer, currency_index, set_evaluation_date
+from .sinks import write_results
+from .validation import screen_trades
+
+BASELINE = 'flat_forward'
+
+
+def benchmark_curve_types(transaction_df, yield_curve_df, convention, evaluation_date, fixings_dir, curve_types=None,
+                          repeat=3, tolerance=0.1):
+    """
+    Bootstrap one currency's curve with every curve type and price the same trades on each.
+
+    Timings are the best of `repeat` runs. Helpers are rebuilt for every bootstrap, as in a
+    production run, and each curve is priced through the QuantLib backend while live, since
+    only flat-forward curves survive freeze_curve unchanged.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades of the currency.
+    yield_curve_df (pandas.DataFrame): The currency's curve quote sheet.
+    convention (CurrencyConvention): The currency conventions.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    curve_types (list): Names from CURVE_TYPES; all of them by default. The flat-forward
+        baseline is always included.
+    repeat (int): Number of timed runs per curve type.
+    tolerance (float): Largest acceptable change of 'Difference' against the baseline, in bps.
+
+    Returns:
+    pandas.DataFrame: One row per curve type with 'Curve Type', 'Bootstrap ms',
+    'Pricing us/trade', 'Priced', 'Max Diff Change', 'Mean Diff Change' (bps) and
+    'Within Tolerance'.
+    """
+    curve_types = [BASELINE] + [name for name in (curve_types or CURVE_TYPES) if name != BASELINE]
+    evaluation_date = set_evaluation_date(evaluation_date, convention)
+    index, handle = currency_index(convention, fixings_dir, evaluation_date)
+
+    rows = []
+    differences = {}
+    for curve_type in curve_types:
+        bootstrap_seconds = pricing_seconds = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            yield_curve = build_yield_curve(build_helpers(yield_curve_df, convention), evaluation_date, curve_type)
+            yield_curve.nodes()
+            bootstrap_seconds = min(bootstrap_seconds, time.perf_counter() - start)
+
+            handle.linkTo(yield_curve)
+            start = time.perf_counter()
+            _, difference = SwapPricer(yield_curve, index, convention).price_arrays(transaction_df)
+            pricing_seconds = min(pricing_seconds, time.perf_counter() - start)
+
+        differences[curve_type] = difference
+        change = np.abs(difference - differences[BASELINE])
+        priced = int((~np.isnan(difference)).sum())
+        rows.append({'Curve Type': curve_type,
+                     'Bootstrap ms': bootstrap_seconds * 1000,
+                     'Pricing us/trade': pricing_seconds * 1e6 / max(len(transaction_df), 1),
+                     'Priced': priced,
+                     'Max Diff Change': np.nanmax(change) if priced else np.nan,
+                     'Mean Diff Change': np.nanmean(change) if priced else np.nan})
+        logging.info(f"{convention.currency} {curve_type}: {rows[-1]}")
+
+    report = pd.DataFrame(rows)
+    report['Within Tolerance'] = report['Max Diff Change'] <= tolerance
+    return report
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Compare curve bootstrap methods on speed and pricing differences')
+    parser.add_argument('transaction_file', help='Transaction data Excel file (may mix currencies)')
+    parser.add_argument('evaluation_date', help='Evaluation date (in format YYYY-MM-DD)')
+    parser.add_argument('--curve', help='Yield curve Excel file for a currency, as CCY=path (repeatable)',
+                        type=parse_curve_argument, action='append', required=True)
+    parser.add_argument('--fixings_dir', help='Directory with historical fixings workbooks',
+                        default='data/raw/historical_fixings')
+    parser.add_argument('--curve_type', choices=sorted(CURVE_TYPES), action='append', default=None,
+                        help='Curve type to benchmark (repeatable); all of them by default')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per curve type; the best is reported')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="Largest acceptable change of 'Difference' against flat forward, in bps")
+    parser.add_argument('--output_file', default=None, help='Also write the report to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    transactions_data, _ = screen_trades(read_excel(args.transaction_file))
+    evaluation_date = to_ql_date(args.evaluation_date)
+    reports = []
+    for currency, path in args.curve:
+        group = transactions_data[transactions_data['Curr'] == currency]
+        report = benchmark_curve_types(group, read_excel(path), get_convention(currency), evaluation_date,
+                                       args.fixings_dir, args.curve_type, args.repeat, args.tolerance)
+        report.insert(0, 'Curr', currency)
+        reports.append(report)
+
+    report = pd.concat(reports, ignore_index=True)
+    print(report.to_string(index=False))
+    if args.output_file:
+        write_results(report, args.output_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+# Name: curve_factory.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Parallel curve bootstrapping. A CurveFactory bootstraps every requested
+# (currency, evaluation date) curve in a process pool and publishes the nodes into one
+# memory-mapped array. Pricing processes attach to it with SharedCurves instead of
+# re-bootstrapping or unpickling curves: the vectorized pricer reads the nodes straight from
+# the shared pages, and QuantLib pricing gets a ql.DiscountCurve rebuilt from them.
+
+import json
+import logging
+import os
+import tempfile
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+import QuantLib as ql
+
+from .conventions import get_convention
+from .curve_store import DAY_COUNTERS, CurveStore, quotes_hash
+from .curves import WarmBootstrapper, bootstrap_curve
+from .dates import to_ql_date
+from .excel import read_excel
+from .files import format_path
+from .fixings import evaluation_fixing
+from .metrics import get_run_metrics, reset_run_metrics, stage
+from .pricer import adjust_evaluation_date, currency_index, set_evaluation_date
+from .vectorized import CurveNodes
+
+NODES_FILE = 'nodes.npy'
+INDEX_FILE = 'curves.json'
+
+# Per-process bootstrappers of the pool workers, keyed by currency
+_bootstrappers = {}
+
+
+def bootstrap_nodes(job):
+    """
+    Bootstrap one curve and return its nodes. Runs inside a pool worker.
+
+    Parameters:
+    job (dict): 'currency', 'date' (YYYY-MM-DD, unadjusted), 'path' (curve quote sheet),
+        'fixings_dir', 'curve_store' (directory or None) and 'warm_start'.
+
+    Returns:
+    dict: The curve's key ('currency', 'date' as the adjusted ISO date, 'quotes_key'),
+    'day_counter', 'nodes', a (nodes, 3) array of date serial, time and log discount, and
+    'record', the WarmBootstrapper record (None if the curve came from the curve store) and
+    'metrics', the job's RunMetrics as a dict; or None if the curve could not be built.
+    """
+    metrics = reset_run_metrics()
+    convention = get_convention(job['currency'])
+    key = (job['currency'], job['warm_start'])
+    if key not in _bootstrappers:
+        _bootstrappers[key] = WarmBootstrapper(convention, job['warm_start'])
+    bootstrapper = _bootstrappers[key]
+    recorded = len(bootstrapper.records)
+    try:
+        evaluation_date = set_evaluation_date(to_ql_date(job['date']), convention)
+        with stage('excel_read'):
+            yield_curve_df = read_excel(job['path'])
+        _, handle = currency_index(convention, job['fixings_dir'], evaluation_date)
+        curve_store = CurveStore(job['curve_store']) if job['curve_store'] else None
+        yield_curve = bootstrap_curve(yield_curve_df, convention, evaluation_date, curve_store, bootstrapper)
+        handle.linkTo(yield_curve)
+    except Exception:
+        logging.exception(f"Failed to bootstrap the {job['currency']} curve for {job['date']}")
+        return None
+
+    curve_nodes = CurveNodes.from_curve(yield_curve)
+    serials = [d.serialNumber() for d in yield_curve.dates()]
+    return {'currency': job['currency'],
+            'date': evaluation_date.ISO(),
+            'quotes_key': quotes_hash(yield_curve_df, fixing=evaluation_fixing(convention, evaluation_date)),
+            'day_counter': yield_curve.dayCounter().name(),
+            'nodes': np.column_stack([serials, curve_nodes.times, curve_nodes.log_discounts]),
+            'record': bootstrapper.records[-1] if len(bootstrapper.records) > recorded else None,
+            'metrics': metrics.to_dict()}
+
+
+def publish_curves(directory, curves):
+    """
+    Write bootstrapped curve nodes to a SharedCurves directory, replacing its contents.
+
+    The nodes are written first and the index last, each atomically.
+
+    Parameters:
+    directory (str): The shared curve directory; created if missing.
+    curves (list): Results of bootstrap_nodes.
+    """
+    os.makedirs(directory, exist_ok=True)
+    width = max((len(curve['nodes']) for curve in curves), default=1)
+    nodes = np.full((len(curves), width, 3), np.nan)
+    index = []
+    for row, curve in enumerate(curves):
+        nodes[row, :len(curve['nodes'])] = curve['nodes']
+        index.append({'currency': curve['currency'], 'date': curve['date'], 'quotes_key': curve['quotes_key'],
+                      'day_counter': curve['day_counter'], 'row': row, 'nodes': len(curve['nodes'])})
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npy')
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, nodes)
+    os.replace(tmp_path, os.path.join(directory, NODES_FILE))
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.json')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, os.path.join(directory, INDEX_FILE))
+
+
+class SharedCurves:
+    """
+    Read-only view of the curves published by a CurveFactory.
+
+    The node array is memory-mapped, so every process attached to the same directory shares
+    one copy of it. SharedCurves has the load/save interface of CurveStore and can be passed
+    wherever a curve store is accepted; curves bootstrapped outside the factory are not
+    published. nodes() returns views of the shared array for the vectorized pricer; see
+    curves.stored_nodes.
+
+    Parameters:
+    directory (str): The shared curve directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            self._index = {(entry['currency'], entry['date'], entry['quotes_key']): entry for entry in json.load(f)}
+        self._nodes = None
+        if self._index:
+            self._nodes = np.load(os.path.join(directory, NODES_FILE), mmap_mode='r')
+
+    def __len__(self):
+        return len(self._index)
+
+    def _entry(self, currency, evaluation_date, quotes_key, count=True):
+        entry = self._index.get((currency, evaluation_date.ISO(), quotes_key))
+        if count:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if entry is None:
+            return None, None
+        return entry, self._nodes[entry['row'], :entry['nodes']]
+
+    def nodes(self, currency, evaluation_date, quotes_key):
+        """
+        Nodes of a published curve, usually looked up after load(); not counted as a hit or miss.
+
+        Returns:
+        CurveNodes: The curve's nodes as views of the shared array, or None if it was not published.
+        """
+        _, nodes = self._entry(currency, evaluation_date, quotes_key, count=False)
+        if nodes is None:
+            return None
+        return CurveNodes(int(nodes[0, 0]), nodes[:, 1], nodes[:, 2])
+
+    def load(self, currency, evaluation_date, quotes_key):
+        """
+        Returns:
+        ql.DiscountCurve: The published curve, or None if it was not published.
+        """
+        entry, nodes = self._entry(currency, evaluation_date, quotes_key)
+        if entry is None:
+            return None
+        curve = ql.DiscountCurve([ql.Date(int(serial)) for serial in nodes[:, 0]],
+                                 np.exp(nodes[:, 2]).tolist(),
+                                 DAY_COUNTERS[entry['day_counter']])
+        curve.enableExtrapolation()
+        return curve
+
+    def save(self, currency, evaluation_date, quotes_key, yield_curve):
+        pass
+
+
+class CurveFactory:
+    """
+    Bootstraps curves in a process pool and publishes them as SharedCurves.
+
+    Parameters:
+    directory (str): The shared curve directory the curves are published to.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    processes (int): Pool size; defaults to the number of CPUs.
+    curve_store (str): Optional CurveStore directory consulted before bootstrapping.
+    warm_start (bool): Hand each worker runs of consecutive dates of one currency and warm-start
+        every bootstrap from the worker's previous curve; see WarmBootstrapper.
+    """
+
+    def __init__(self, directory, fixings_dir, processes=None, curve_store=None, warm_start=False):
+        self.directory = directory
+        self.fixings_dir = fixings_dir
+        self.processes = processes
+        self.curve_store = curve_store
+        self.warm_start = warm_start
+        self.records = []
+
+    def build(self, requests):
+        """
+        Bootstrap and publish curves.
+
+        Parameters:
+        requests (iterable): (currency, unadjusted evaluation date, curve file path) tuples.
+
+        Returns:
+        SharedCurves: The published curves.
+        """
+        jobs = [{'currency': currency, 'date': f"{pd.Timestamp(date):%Y-%m-%d}", 'path': path,
+                 'fixings_dir': self.fixings_dir, 'curve_store': self.curve_store, 'warm_start': self.warm_start}
+                for currency, date, path in requests]
+        chunksize = 1
+        if self.warm_start:
+            jobs.sort(key=lambda job: (job['currency'], job['date']))
+            chunksize = max(1, len(jobs) // ((self.processes or os.cpu_count() or 1) * 4))
+        if jobs:
+            with Pool(processes=self.processes) as pool:
+                curves = [curve for curve in pool.imap(bootstrap_nodes, jobs, chunksize) if curve is not None]
+        else:
+            curves = []
+        self.records = [curve['record'] for curve in curves if curve['record'] is not None]
+        for curve in curves:
+            get_run_metrics().merge(curve['metrics'])
+        publish_curves(self.directory, curves)
+        logging.info(f"Published {len(curves)} of {len(jobs)} curves to {self.directory}")
+        return SharedCurves(self.directory)
+
+    def report(self):
+        """
+        Returns:
+        pandas.DataFrame: The bootstrap records of the last build, one row per bootstrapped curve.
+        """
+        return pd.DataFrame(self.records, columns=WarmBootstrapper(None).report().columns)
+
+
+def curve_requests(dates, templates, roll=False):
+    """
+    List the curve files of every evaluation date and currency that exist.
+
+    Parameters:
+    dates (iterable): Evaluation dates, or (evaluation date, currency) pairs to request only
+        the given currencies.
+    templates (dict): Curve file path templates keyed by currency; see files.format_path.
+    roll (bool): Fill the templates with the date rolled by the currency's calendar, as
+        curve_file_loader does, instead of the unadjusted date.
+
+    Returns:
+    list: (currency, date, path) tuples for CurveFactory.build.
+    """
+    requests = []
+    for item in dates:
+        date, currencies = (item[0], [item[1]]) if isinstance(item, tuple) else (item, templates)
+        for currency in currencies:
+            if currency not in templates:
+                continue
+            file_date = pd.Timestamp(date)
+            if roll:
+                file_date = adjust_evaluation_date(to_ql_date(file_date), get_convention(currency)).to_date()
+            path = format_path(templates[currency], file_date, currency)
+            if os.path.exists(path):
+                requests.append((currency, date, path))
+            else:
+                logging.warning(f"No {currency} curve file {path}")
+    return requests
@@ -0,0 +1,153 @@
+# Name: dates.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Date helpers shared by the curve builder and the swap pricer. Whole columns
+# are parsed once with pandas and mapped to QuantLib serial numbers with array arithmetic;
+# ql.Date objects are only built when a trade is actually priced.
+
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import QuantLib as ql
+
+DATE_FORMATS = ["%m/%d/%Y", "%m/%d/%y"]
+
+# ql.Date serial number of 1970-01-01
+EPOCH_SERIAL = 25569
+
+
+def parse_date(date_string):
+    """
+    Parse an SDR/Bloomberg date string into a QuantLib date.
+
+    Parameters:
+    date_string (str): A date in one of DATE_FORMATS.
+
+    Returns:
+    ql.Date: The parsed date, or None if no format matched.
+    """
+    if isinstance(date_string, datetime):
+        return to_ql_date(date_string)
+    for date_format in DATE_FORMATS:
+        try:
+            return ql.DateParser.parseFormatted(date_string, date_format)
+        except Exception:
+            pass
+
+
+def to_ql_date(value):
+    """
+    Convert a datetime-like value or a YYYY-MM-DD string into a QuantLib date.
+
+    Parameters:
+    value (str, datetime or pandas.Timestamp): The date to convert.
+
+    Returns:
+    ql.Date: The converted date.
+    """
+    if isinstance(value, str):
+        value = datetime.strptime(value, '%Y-%m-%d')
+    return ql.Date(value.day, value.month, value.year)
+
+
+def parse_date_column(column):
+    """
+    Parse a date column into QuantLib serial numbers.
+
+    Strings are tried against DATE_FORMATS in order; values that are already datetimes
+    (e.g. date cells read from Excel) are converted directly.
+
+    Parameters:
+    column (pandas.Series): Date strings and/or datetimes.
+
+    Returns:
+    numpy.ndarray: float serial numbers, NaN where the value is missing or unparseable.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column):
+        dates = column
+    else:
+        dates = pd.to_datetime(column, format=DATE_FORMATS[0], errors='coerce')
+        for date_format in DATE_FORMATS[1:]:
+            missing = (dates.isna() & column.notna()).to_numpy()
+            if not missing.any():
+                break
+            dates[missing] = pd.to_datetime(column[missing], format=date_format, errors='coerce').to_numpy()
+    serials = (dates.dt.normalize() - pd.Timestamp('1970-01-01')).dt.days + EPOCH_SERIAL
+    return serials.to_numpy(dtype=float, na_value=np.nan)
+
+
+def parse_trade_dates(column):
+    """
+    Parse 'Trade Time' values into trade dates.
+
+    ISO 8601 timestamps are parsed in one pass; only the values left over are parsed one by one.
+
+    Parameters:
+    column (pandas.Series): Trade timestamps as strings and/or datetimes.
+
+    Returns:
+    pandas.Series: Timestamps normalized to midnight, NaT where the value is missing or unparseable.
+    """
+    dates = pd.to_datetime(column, format='ISO8601', errors='coerce')
+    missing = (dates.isna() & column.notna()).to_numpy()
+    if missing.any():
+        dates[missing] = pd.to_datetime(column[missing], format='mixed', errors='coerce').to_numpy()
+    return dates.dt.normalize()
+
+
+def parse_date_columns(df, columns=('Effective', 'Maturity')):
+    """
+    Parse several date columns and report unparseable values in one warning per column.
+
+    Parameters:
+    df (pandas.DataFrame): The transactions.
+    columns (tuple): Names of the date columns.
+
+    Returns:
+    dict: Serial number arrays keyed by column name.
+    """
+    parsed = {}
+    for column in columns:
+        serials = parse_date_column(df[column])
+        bad = np.isnan(serials) & df[column].notna().to_numpy()
+        if bad.any():
+            sample = df.index[bad][:10].tolist()
+            logging.warning(f"{int(bad.sum())} rows with unparseable '{column}' dates "
+                            f"(first row labels: {sample}, values: {df[column][bad].head(3).tolist()})")
+        parsed[column] = serials
+    return parsed
+
+
+def serial_to_date(serial):
+    """
+    Build a ql.Date from a serial number produced by parse_date_column.
+
+    Returns:
+    ql.Date: The date, or None for NaN.
+    """
+    if np.isnan(serial):
+        return None
+    return ql.Date(int(serial))
+
+
+def serials_to_ymd(serials):
+    """
+    Split ql.Date serial numbers into year, month and day arrays.
+    """
+    days = (np.asarray(serials, dtype=np.int64) - EPOCH_SERIAL).astype('datetime64[D]')
+    years = days.astype('datetime64[Y]')
+    months = days.astype('datetime64[M]')
+    return (years.astype(np.int64) + 1970,
+            (months - years).astype(np.int64) + 1,
+            (days - months).astype(np.int64) + 1)
+
+
+def ymd_to_serials(years, months, days):
+    """
+    Combine year, month and day arrays into ql.Date serial numbers.
+    """
+    month_starts = ((np.asarray(years, dtype=np.int64) - 1970) * 12 +
+                    np.asarray(months, dtype=np.int64) - 1).astype('datetime64[M]')
+    return month_starts.astype('datetime64[D]').astype(np.int64) + np.asarray(days, dtype=np.int64) - 1 + EPOCH_SERIAL
@@ -0,0 +1,18 @@
+# Name: excel.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Fast Excel ingestion; re-exports src/utils/excel_cache.py, which the analysis
+# scripts outside src/pricing share. src/utils is appended to sys.path, so it never hides
+# another module.
+
+import os
+import sys
+
+_UTILS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utils'))
+if _UTILS_DIR not in sys.path:
+    sys.path.append(_UTILS_DIR)
+
+from excel_cache import ENGINE, SIDECAR_DIR_VARIABLE, main, read_excel, sidecar_path  # noqa: E402,F401
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# Name: files.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Path templates for per-date transaction and curve files.
+
+
+def format_path(template, date, currency=None):
+    """
+    Fill a path template. Available fields are {date} (a Timestamp or datetime, so
+    {date:%m%d%Y} works), {ccy} and {ccy_lower}.
+    """
+    currency = currency or ''
+    return template.format(date=date, ccy=currency, ccy_lower=currency.lower())
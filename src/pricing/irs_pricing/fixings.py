@@ -0,0 +1,162 @@
+# Name: fixings.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Historical index fixings. Each Bloomberg fixings workbook is converted once into
+# a compact .npz sidecar (date serial numbers and decimal rates) and loaded into QuantLib with
+# one bulk addFixings call per index instead of one addFixing call per row.
+
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import QuantLib as ql
+
+from .dates import EPOCH_SERIAL
+from .excel import read_excel
+from .metrics import stage
+
+
+def convert_fixings(fixings_df, column):
+    """
+    Convert a fixings sheet into date serial numbers and decimal rates.
+
+    Parameters:
+    fixings_df (pandas.DataFrame): Fixings with a 'Date' column and the rate (in percent) in `column`.
+    column (str): The rate column, e.g. 'PX_ASK' or 'PX_LAST'.
+
+    Returns:
+    tuple: (int32 serial numbers, float64 rates), sorted by date, rows without a rate dropped.
+    """
+    dates = pd.to_datetime(fixings_df['Date'], errors='coerce')
+    rates = pd.to_numeric(fixings_df[column], errors='coerce') / 100  # Convert percentage to decimal
+    valid = dates.notna() & rates.notna()
+    serials = ((dates[valid] - pd.Timestamp('1970-01-01')).dt.days + EPOCH_SERIAL).to_numpy(dtype=np.int32)
+    rates = rates[valid].to_numpy(dtype=np.float64)
+    order = np.argsort(serials, kind='stable')
+    return serials[order], rates[order]
+
+
+class FixingsStore:
+    """
+    Historical fixings of every registered currency, shared across currencies and runs.
+
+    Parameters:
+    fixings_dir (str): Directory holding the fixings workbooks. Converted sidecars are written
+        next to them as <workbook>.<column>.npz and refreshed when the workbook is newer.
+    """
+
+    def __init__(self, fixings_dir):
+        self.fixings_dir = fixings_dir
+        self._series = {}
+        self._valid = {}
+        self._applied = {}
+
+    def series(self, convention):
+        """
+        Returns:
+        tuple: (serial numbers, rates) for the currency, or None if it has no fixings workbook.
+        """
+        if convention.fixings_file is None:
+            return None
+        key = (convention.fixings_file, convention.fixings_column)
+        if key not in self._series:
+            self._series[key] = self._load(convention)
+        return self._series[key]
+
+    def _load(self, convention):
+        path = os.path.join(self.fixings_dir, convention.fixings_file)
+        sidecar = f"{path}.{convention.fixings_column}.npz"
+
+        if os.path.exists(sidecar) and (not os.path.exists(path) or
+                                        os.path.getmtime(sidecar) >= os.path.getmtime(path)):
+            with np.load(sidecar) as stored:
+                return stored['serials'], stored['rates']
+
+        if not os.path.exists(path):
+            logging.warning(f"Fixings file {path} not found; pricing {convention.currency} without historical fixings")
+            return None
+
+        serials, rates = convert_fixings(read_excel(path, cache=False), convention.fixings_column)
+        try:
+            np.savez(sidecar, serials=serials, rates=rates)
+        except OSError as e:
+            logging.warning(f"Could not write fixings sidecar {sidecar}: {e}")
+        return serials, rates
+
+    def apply(self, index, convention, evaluation_date):
+        """
+        Add the fixings on or before the evaluation date to an index in one bulk call.
+
+        QuantLib keeps fixings globally per index name, so only fixings not yet added in this
+        process are sent; moving to an earlier evaluation date clears and reloads the history.
+
+        Parameters:
+        index (ql.IborIndex): The index receiving the fixings.
+        convention (CurrencyConvention): The currency conventions naming the workbook.
+        evaluation_date (ql.Date): Fixings after this date are ignored.
+        """
+        series = self.series(convention)
+        if series is None:
+            return
+        serials, rates = series
+        name = index.name()
+        if name not in self._valid:
+            # addFixings rejects the whole batch if any date is not a fixing date of the index
+            self._valid[name] = np.array([index.isValidFixingDate(ql.Date(int(s))) for s in serials], dtype=bool)
+            dropped = int((~self._valid[name]).sum())
+            if dropped:
+                logging.warning(f"Ignoring {dropped} {name} fixings on non-fixing dates")
+        cutoff = evaluation_date.serialNumber()
+        applied = self._applied.get(name)
+
+        if applied is None or cutoff < applied:
+            index.clearFixings()
+            lower = -1
+        else:
+            lower = applied
+        selected = self._valid[name] & (serials > lower) & (serials <= cutoff)
+        if selected.any():
+            index.addFixings([ql.Date(int(s)) for s in serials[selected]], rates[selected].tolist(), True)
+        self._applied[name] = cutoff
+
+
+_stores = {}
+
+
+def get_fixings_store(fixings_dir):
+    """
+    Return the process-wide FixingsStore for a fixings directory.
+    """
+    if fixings_dir not in _stores:
+        _stores[fixings_dir] = FixingsStore(fixings_dir)
+    return _stores[fixings_dir]
+
+
+def evaluation_fixing(convention, evaluation_date):
+    """
+    The historical fixing of a currency's index on the evaluation date, as loaded by load_fixings.
+
+    QuantLib keeps fixings globally per index name, so any instance of the index sees them.
+
+    Returns:
+    float: The fixing, or None if there is none for that date.
+    """
+    index = convention.index(ql.YieldTermStructureHandle())
+    if not index.hasHistoricalFixing(evaluation_date):
+        return None
+    return index.pastFixing(evaluation_date)
+
+
+def load_fixings(index, convention, fixings_dir, evaluation_date):
+    """
+    Load the registered fixings for a currency into its index.
+
+    Parameters:
+    index (ql.IborIndex): The index receiving the fixings.
+    convention (CurrencyConvention): The currency conventions naming the workbook.
+    fixings_dir (str): Directory holding the fixings workbooks.
+    evaluation_date (ql.Date): Fixings after this date are ignored.
+    """
+    with stage('fixings_load'):
+        get_fixings_store(fixings_dir).apply(index, convention, evaluation_date)
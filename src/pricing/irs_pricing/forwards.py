@@ -0,0 +1,100 @@
+# Name: forwards.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Memo of projected float-leg forwards. Coupons of the same index fixing on the
+# same date and ending on the same date have the same forward on a given curve, so each one
+# is projected once per curve and every other coupon is a lookup.
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ForwardCache:
+    """
+    Forward rates keyed by (index name, curve key) and then by (fixing date, end of the
+    estimation period) serial numbers.
+
+    QuantLib's par coupons estimate the forward from the fixing value date to the accrual end,
+    so the accrual end is part of the key next to the fixing date.
+
+    Parameters:
+    maxcurves (int): Maximum number of (index, curve) tables kept; the least recently used
+        table is evicted first.
+    """
+
+    def __init__(self, maxcurves=256):
+        self.maxcurves = maxcurves
+        self.hits = 0
+        self.misses = 0
+        self._tables = OrderedDict()
+
+    def __len__(self):
+        return sum(len(table) for table in self._tables.values())
+
+    def _table(self, index_name, curve_key):
+        key = (index_name, curve_key)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = {}
+            if len(self._tables) > self.maxcurves:
+                self._tables.popitem(last=False)
+        else:
+            self._tables.move_to_end(key)
+        return table
+
+    def forwards(self, index_name, curve_key, fixing_dates, value_starts, value_ends, project, coupons=None):
+        """
+        Look up the forwards of unique (fixing date, value start, value end) triples, projecting
+        the missing ones in one vectorized call.
+
+        Parameters:
+        index_name (str): The index name, e.g. 'USDLibor3M Actual/360'.
+        curve_key (str): Key of the forecasting curve (see CurveNodes.key).
+        fixing_dates (numpy.ndarray): Fixing date serial numbers.
+        value_starts (numpy.ndarray): Estimation period start serial numbers.
+        value_ends (numpy.ndarray): Estimation period end serial numbers.
+        project (callable): project(value_starts, value_ends) returning forwards as an array.
+        coupons (numpy.ndarray): Optional number of coupons sharing each triple, for the statistics.
+
+        Returns:
+        numpy.ndarray: Forward rates aligned to the inputs.
+        """
+        table = self._table(index_name, curve_key)
+        keys = list(zip(fixing_dates.tolist(), value_ends.tolist()))
+        rates = np.array([table.get(key, np.nan) for key in keys], dtype=float)
+        missing = np.isnan(rates)
+        if missing.any():
+            rates[missing] = project(value_starts[missing], value_ends[missing])
+            table.update(zip((key for key, miss in zip(keys, missing) if miss), rates[missing].tolist()))
+
+        coupons = coupons if coupons is not None else np.ones(len(keys), dtype=np.int64)
+        self.misses += int(missing.sum())
+        self.hits += int(coupons.sum()) - int(missing.sum())
+        return rates
+
+    def stats(self):
+        """
+        Returns:
+        dict: Coupon hits, projected forwards (misses), hit rate and number of stored forwards.
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self)}
+
+    def clear(self):
+        self._tables.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_forward_cache = ForwardCache()
+
+
+def get_forward_cache():
+    """
+    Return the process-wide ForwardCache shared by every vectorized pricer.
+    """
+    return _forward_cache
@@ -0,0 +1,155 @@
+# Name: metrics.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Run instrumentation. The pricing code times its stages (Excel read, fixings
+# load, helper build, bootstrap, pricing, output write) and counts trades on a process-wide
+# RunMetrics, which the entry points write out as JSON with --metrics_file.
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+STAGES = ('excel_read', 'fixings_load', 'helper_build', 'bootstrap', 'pricing', 'output_write')
+COUNTERS = ('priced', 'skipped', 'failed')
+
+# Upper bounds of the per-trade pricing latency buckets, in microseconds; the last bucket is open
+LATENCY_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class RunMetrics:
+    """
+    Wall and CPU time per stage, trade counters and a per-trade pricing latency histogram.
+
+    Stage times are exclusive: time spent in a stage nested inside another (helpers built
+    during a bootstrap, say) is charged to the inner stage only, so the stages add up to the
+    instrumented part of the run.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.stages = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.latency = np.zeros(len(LATENCY_BUCKETS_US) + 1, dtype=np.int64)
+        self.latency_seconds = 0.0
+        self.latency_max = 0.0
+        self._open = []
+
+    def _stage(self, name):
+        if name not in self.stages:
+            self.stages[name] = {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0}
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time the body of a with block as one call of a stage.
+        """
+        # [wall, cpu] spent in stages nested inside this one
+        nested = [0.0, 0.0]
+        self._open.append(nested)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._open.pop()
+            entry = self._stage(name)
+            entry['calls'] += 1
+            entry['wall_seconds'] += wall - nested[0]
+            entry['cpu_seconds'] += cpu - nested[1]
+            if self._open:
+                self._open[-1][0] += wall
+                self._open[-1][1] += cpu
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def observe_latency(self, seconds, n=1):
+        """
+        Record the pricing latency of `n` trades that each took `seconds`.
+        """
+        bucket = np.searchsorted(LATENCY_BUCKETS_US, seconds * 1e6, side='left')
+        self.latency[bucket] += n
+        self.latency_seconds += seconds * n
+        self.latency_max = max(self.latency_max, seconds)
+
+    def merge(self, other):
+        """
+        Add the metrics of another run, e.g. a pool worker's to_dict(), to this one.
+        """
+        for name, entry in other['stages'].items():
+            own = self._stage(name)
+            for key in own:
+                own[key] += entry[key]
+        for name, value in other['counters'].items():
+            self.count(name, value)
+        latency = other['latency']
+        self.latency += np.array([bucket['trades'] for bucket in latency['histogram']], dtype=np.int64)
+        self.latency_seconds += latency['mean_us'] * latency['trades'] / 1e6
+        self.latency_max = max(self.latency_max, latency['max_us'] / 1e6)
+
+    def to_dict(self):
+        trades = int(self.latency.sum())
+        bounds = [f"<={bound}" for bound in LATENCY_BUCKETS_US] + [f">{LATENCY_BUCKETS_US[-1]}"]
+        return {'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+                'pid': os.getpid(),
+                'stages': {name: dict(entry) for name, entry in self.stages.items()},
+                'counters': dict(self.counters),
+                'latency': {'trades': trades,
+                            'mean_us': self.latency_seconds * 1e6 / trades if trades else 0.0,
+                            'max_us': self.latency_max * 1e6,
+                            'histogram': [{'us': bound, 'trades': int(n)} for bound, n in zip(bounds, self.latency)]}}
+
+    def write(self, path):
+        """
+        Write the metrics to a JSON file, replacing it.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+_metrics = RunMetrics()
+
+
+def get_run_metrics():
+    """
+    Return the process-wide RunMetrics.
+    """
+    return _metrics
+
+
+def reset_run_metrics():
+    """
+    Start a new process-wide RunMetrics and return it.
+    """
+    global _metrics
+    _metrics = RunMetrics()
+    return _metrics
+
+
+def stage(name):
+    """
+    Time a with block as a stage of the process-wide RunMetrics.
+    """
+    return _metrics.stage(name)
+
+
+def count_trades(rejected, priced_df):
+    """
+    Count the priced trades of a run and the trades rejected by screening on the process-wide
+    RunMetrics.
+
+    The other trades are counted where they drop out: the pricers' price_arrays count the
+    trades they could not price as failed, and trades left out for lack of a curve are
+    counted as skipped where they are left out.
+
+    Parameters:
+    rejected (int): Number of trades rejected before pricing.
+    priced_df (pandas.DataFrame): The priced trades.
+    """
+    priced = int(priced_df['Fair Rate'].notna().sum()) if len(priced_df) else 0
+    _metrics.count('priced', priced)
+    _metrics.count('skipped', rejected)
@@ -0,0 +1,425 @@
+# Name: pricer.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Prices SDR fixed/float swap trades against bootstrapped curves.
+# A mixed-currency transaction file is priced in a single pass, one currency group at a time.
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+import QuantLib as ql
+
+from .conventions import CONVENTIONS, get_convention
+from .curve_store import quotes_hash
+from .curves import bootstrap_curve, stored_nodes
+from .dates import parse_date, parse_date_columns, parse_trade_dates, serial_to_date, to_ql_date
+from .fixings import evaluation_fixing, load_fixings
+from .forwards import get_forward_cache
+from .metrics import get_run_metrics
+from .schedules import ScheduleCache
+from .trade_store import trade_hashes
+
+
+def normalize_rate(rate):
+    """
+    Convert an SDR rate to percent. Rates above 10 are assumed to be quoted in basis points.
+    """
+    return rate / 100 if rate > 10 else rate
+
+
+class SwapPricer:
+    """
+    Prices fixed/float swaps against one curve.
+
+    The forwarding index, the discounting handle and the swap engine are built once
+    and shared by every trade priced through this object.
+
+    Parameters:
+    yield_curve (ql.YieldTermStructure): The bootstrapped forwarding and discounting curve.
+    index (ql.IborIndex): The floating index of the currency; it is re-linked to `yield_curve`.
+    convention (CurrencyConvention): The currency conventions.
+    schedule_cache (ScheduleCache): Shared schedule cache; a private one is created if omitted.
+    """
+
+    def __init__(self, yield_curve, index, convention, schedule_cache=None):
+        self.convention = convention
+        self.schedule_cache = schedule_cache if schedule_cache is not None else ScheduleCache()
+        self.curve_handle = ql.YieldTermStructureHandle(yield_curve)
+        self.index = index.clone(self.curve_handle)
+        self.engine = ql.DiscountingSwapEngine(self.curve_handle)
+
+    def schedule(self, effective_date, maturity_date, frequency):
+        convention = self.convention
+        return self.schedule_cache.get(effective_date,
+                                       maturity_date,
+                                       frequency,
+                                       convention.calendar,
+                                       ql.ModifiedFollowing,
+                                       convention.schedule_rule,
+                                       convention.end_of_month)
+
+    def price_trade(self, row, effective_date=None, maturity_date=None):
+        """
+        Price a single SDR trade.
+
+        Parameters:
+        row (pandas.Series): One transaction row.
+        effective_date (ql.Date): Pre-parsed 'Effective' date; parsed from the row if omitted.
+        maturity_date (ql.Date): Pre-parsed 'Maturity' date; parsed from the row if omitted.
+
+        Returns:
+        tuple: (fair rate in percent, difference in bps), or None if the trade cannot be priced.
+        """
+        if effective_date is None:
+            effective_date = parse_date(row['Effective'])
+        if maturity_date is None:
+            maturity_date = parse_date(row['Maturity'])
+        if effective_date is None or maturity_date is None:
+            return None
+        built = self.build_swap(row, effective_date, maturity_date)
+        if built is None:
+            return None
+
+        swap, fixed_rate = built
+        fair_rate = swap.fairRate()*100
+        difference = (fixed_rate - fair_rate)*100
+
+        return fair_rate, difference
+
+    def build_swap(self, row, effective_date, maturity_date):
+        """
+        Build the payer VanillaSwap of an SDR trade on the pricer's index and engine.
+
+        Parameters:
+        row (pandas.Series): One transaction row.
+        effective_date (ql.Date): The parsed 'Effective' date.
+        maturity_date (ql.Date): The parsed 'Maturity' date.
+
+        Returns:
+        tuple: (ql.VanillaSwap, fixed rate in percent), or None if the trade cannot be priced.
+        """
+        rate_1, leg_1, rate_2, leg_2, notional, payment_frequency_1, payment_frequency_2 = row['Rate 1'], row['Leg 1'], row['Rate 2'], row['Leg 2'], row['Not.'], row['PF 1'], row['PF 2']
+        if payment_frequency_1 == '1T' or payment_frequency_2 == '1T' or maturity_date <= effective_date:
+            return None
+        fixed_leg_frequency = ql.Period(payment_frequency_1 if leg_1 == 'FIXED' else payment_frequency_2)
+        float_leg_frequency = ql.Period(payment_frequency_1 if leg_1 != 'FIXED' else payment_frequency_2)
+
+        fixed_rate = normalize_rate(rate_1 if leg_1 == 'FIXED' else rate_2)
+        float_rate = normalize_rate(rate_1 if leg_1 != 'FIXED' else rate_2)
+
+        if pd.isnull(float_rate):
+            float_rate = 0
+
+        fixed_schedule = self.schedule(effective_date, maturity_date, fixed_leg_frequency)
+        float_schedule = self.schedule(effective_date, maturity_date, float_leg_frequency)
+        swap = ql.VanillaSwap(ql.VanillaSwap.Payer,
+                              notional,
+                              fixed_schedule,
+                              fixed_rate/100,
+                              self.convention.fixed_day_counter,
+                              float_schedule,
+                              self.index,
+                              float_rate/100,
+                              self.index.dayCounter())
+        swap.setPricingEngine(self.engine)
+        return swap, fixed_rate
+
+    def price_arrays(self, transaction_df):
+        """
+        Price every trade in a DataFrame.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades of the pricer's currency.
+
+        Returns:
+        tuple: (fair rates in percent, differences in bps) as arrays aligned to the input rows;
+        trades that cannot be priced are NaN and counted as failed in the run metrics.
+        """
+        metrics = get_run_metrics()
+        fair_rate = np.full(len(transaction_df), np.nan)
+        difference = np.full(len(transaction_df), np.nan)
+        with metrics.stage('pricing'):
+            dates = parse_date_columns(transaction_df)
+            rows = zip(transaction_df.index, transaction_df.to_dict('records'), dates['Effective'], dates['Maturity'])
+            for position, (label, row, effective, maturity) in enumerate(rows):
+                if np.isnan(effective) or np.isnan(maturity):
+                    continue  # already reported by parse_date_columns
+                start = time.perf_counter()
+                try:
+                    priced = self.price_trade(row, serial_to_date(effective), serial_to_date(maturity))
+                    if priced is None:
+                        continue
+
+                    fair_rate[position], difference[position] = priced
+
+                except Exception as e:
+                    logging.error(f"Error processing swap at row {label}: {e}")
+                    continue
+
+                finally:
+                    metrics.observe_latency(time.perf_counter() - start)
+
+        metrics.count('failed', np.isnan(fair_rate).sum())
+        return fair_rate, difference
+
+    def price(self, transaction_df):
+        """
+        Price a batch of trades.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades of the pricer's currency.
+
+        Returns:
+        pandas.DataFrame: The priced trades with 'Fair Rate' (percent) and 'Difference' (bps) columns.
+        """
+        return attach_prices(transaction_df, *self.price_arrays(transaction_df))
+
+
+def attach_prices(transaction_df, fair_rate, difference):
+    """
+    Keep the priced rows of a batch and add the 'Fair Rate' and 'Difference' columns.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): The trades.
+    fair_rate (numpy.ndarray): Fair rates aligned to the trades, NaN where not priced.
+    difference (numpy.ndarray): Differences aligned to the trades.
+
+    Returns:
+    pandas.DataFrame: The priced trades.
+    """
+    priced = ~np.isnan(fair_rate)
+    return transaction_df.loc[priced].assign(**{'Fair Rate': fair_rate[priced], 'Difference': difference[priced]})
+
+
+def price_swaps(transaction_df, yield_curve, index, convention, schedule_cache=None):
+    """
+    Price fixed/float swaps against a single curve.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades of one currency.
+    yield_curve (ql.YieldTermStructure): The bootstrapped forwarding and discounting curve.
+    index (ql.IborIndex): The floating index of the currency.
+    convention (CurrencyConvention): The currency conventions.
+    schedule_cache (ScheduleCache): Optional schedule cache shared across calls.
+
+    Returns:
+    pandas.DataFrame: The priced trades with 'Fair Rate' (percent) and 'Difference' (bps) columns.
+    """
+    return SwapPricer(yield_curve, index, convention, schedule_cache).price(transaction_df)
+
+
+def get_pricer_class(backend):
+    """
+    Return the pricer class for a backend name: 'quantlib' (SwapPricer) or 'vectorized' (VectorizedPricer).
+    """
+    if backend == 'quantlib':
+        return SwapPricer
+    if backend == 'vectorized':
+        from .vectorized import VectorizedPricer
+        return VectorizedPricer
+    raise ValueError(f"Unknown pricing backend '{backend}'")
+
+
+def make_pricer(backend, yield_curve, index, convention, schedule_cache=None, nodes=None):
+    """
+    Create the pricer of a backend.
+
+    `nodes` (see curves.stored_nodes) are handed to the vectorized pricer, which then prices
+    off the shared node arrays instead of copying the nodes out of the curve; the QuantLib
+    pricer ignores them.
+    """
+    if backend == 'vectorized':
+        return get_pricer_class(backend)(yield_curve, index, convention, schedule_cache, nodes=nodes)
+    return get_pricer_class(backend)(yield_curve, index, convention, schedule_cache)
+
+
+def adjust_evaluation_date(evaluation_date, convention):
+    """
+    Roll the evaluation date with the currency's calendar.
+
+    Returns:
+    ql.Date: The adjusted evaluation date.
+    """
+    calendar = convention.evaluation_calendar
+    if calendar is not None and not calendar.isBusinessDay(evaluation_date):
+        evaluation_date = calendar.adjust(evaluation_date)
+    return evaluation_date
+
+
+def set_evaluation_date(evaluation_date, convention):
+    """
+    Roll the evaluation date with the currency's calendar and make it the global QuantLib date.
+
+    Returns:
+    ql.Date: The adjusted evaluation date.
+    """
+    evaluation_date = adjust_evaluation_date(evaluation_date, convention)
+    ql.Settings.instance().evaluationDate = evaluation_date
+    return evaluation_date
+
+
+def currency_index(convention, fixings_dir, evaluation_date):
+    """
+    Create the currency's index on an empty relinkable handle and load its fixings.
+
+    Fixings have to be in place before the curve is bootstrapped: swap rate helpers whose
+    first coupon fixes on the evaluation date use that day's historical fixing if there is one.
+
+    Returns:
+    tuple: (ql.IborIndex, ql.RelinkableYieldTermStructureHandle to link the curve to).
+    """
+    handle = ql.RelinkableYieldTermStructureHandle()
+    index = convention.index(handle)
+    load_fixings(index, convention, fixings_dir, evaluation_date)
+    return index, handle
+
+
+def price_currency(transaction_df, yield_curve_df, convention, evaluation_date, fixings_dir, schedule_cache=None,
+                   backend='quantlib', cross_check=0, curve_store=None, trade_store=None):
+    """
+    Bootstrap one currency's curve, load its fixings and price its trades.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades of one currency.
+    yield_curve_df (pandas.DataFrame): The currency's curve quote sheet.
+    convention (CurrencyConvention): The currency conventions.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    schedule_cache (ScheduleCache): Optional schedule cache shared across currencies.
+    backend (str): 'quantlib' or 'vectorized'.
+    cross_check (int): For the vectorized backend, number of trades re-priced through QuantLib as a check.
+    curve_store (CurveStore): Optional persistent store of bootstrapped curves.
+    trade_store (TradeStore): Optional store of priced trades; only trades not priced before
+        against the same quotes, fixing and evaluation date are priced, and the curve is not
+        bootstrapped at all if every trade is found.
+
+    Returns:
+    pandas.DataFrame: The priced trades.
+    """
+    evaluation_date = set_evaluation_date(evaluation_date, convention)
+    index, handle = currency_index(convention, fixings_dir, evaluation_date)
+
+    if trade_store is not None:
+        quotes_key = quotes_hash(yield_curve_df, fixing=evaluation_fixing(convention, evaluation_date))
+        hashes = trade_hashes(transaction_df)
+        found, fair_rate, difference = trade_store.lookup(convention.currency, evaluation_date, quotes_key, hashes)
+        get_run_metrics().count('failed', np.isnan(fair_rate[found]).sum())
+        if found.all():
+            return attach_prices(transaction_df, fair_rate, difference)
+        all_trades_df, transaction_df = transaction_df, transaction_df.loc[~found]
+
+    yield_curve = bootstrap_curve(yield_curve_df, convention, evaluation_date, curve_store)
+    handle.linkTo(yield_curve)
+
+    nodes = stored_nodes(yield_curve_df, convention, evaluation_date, curve_store) if backend == 'vectorized' else None
+    pricer = make_pricer(backend, yield_curve, index, convention, schedule_cache, nodes)
+    if cross_check and backend == 'vectorized':
+        pricer.cross_check(transaction_df, sample_size=cross_check)
+    if trade_store is None:
+        return pricer.price(transaction_df)
+
+    new_fair_rate, new_difference = pricer.price_arrays(transaction_df)
+    trade_store.save(convention.currency, evaluation_date, quotes_key, hashes[~found], new_fair_rate, new_difference)
+    fair_rate[~found], difference[~found] = new_fair_rate, new_difference
+    return attach_prices(all_trades_df, fair_rate, difference)
+
+
+def price_transactions(transactions_df, yield_curves, evaluation_date, fixings_dir, backend='quantlib',
+                       cross_check=0, curve_store=None, trade_store=None):
+    """
+    Price a mixed-currency transaction file in a single pass.
+
+    Parameters:
+    transactions_df (pandas.DataFrame): SDR trades; the 'Curr' column selects the conventions.
+    yield_curves (dict): Curve quote sheets keyed by currency code.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    cross_check (int): For the vectorized backend, number of trades per currency re-priced through QuantLib.
+    curve_store (CurveStore): Optional persistent store of bootstrapped curves.
+    trade_store (TradeStore): Optional store of priced trades for incremental re-pricing.
+
+    Returns:
+    pandas.DataFrame: The priced trades in input order.
+    """
+    schedule_cache = ScheduleCache()
+    priced = []
+    for currency, group in transactions_df.groupby('Curr', sort=False):
+        if currency not in yield_curves:
+            logging.warning(f"No yield curve supplied for {currency}; skipping {len(group)} trades")
+            get_run_metrics().count('skipped', len(group))
+            continue
+        convention = get_convention(currency)
+        priced.append(price_currency(group, yield_curves[currency], convention, evaluation_date, fixings_dir,
+                                     schedule_cache, backend, cross_check, curve_store, trade_store))
+    logging.info(f"Schedule cache: {schedule_cache.stats()}")
+    if backend == 'vectorized':
+        logging.info(f"Forward cache: {get_forward_cache().stats()}")
+    if trade_store is not None:
+        logging.info(f"Trade store: {trade_store.stats()}")
+
+    return combine_priced(priced, transactions_df.columns)
+
+
+def price_by_trade_date(transactions_df, curve_cache, fixings_dir, backend='quantlib', schedule_cache=None):
+    """
+    Price a multi-day, mixed-currency transaction file, each trade against the curve of its trade date.
+
+    Trades are grouped by the date of 'Trade Time' and by 'Curr'; groups are priced in date order
+    with the group's date (rolled by the currency calendar) as evaluation date. Trades without a
+    parseable 'Trade Time', or in a currency without conventions, are skipped with a warning.
+
+    Parameters:
+    transactions_df (pandas.DataFrame): SDR trades.
+    curve_cache (CurveCache): Supplies the bootstrapped curve per (currency, date).
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    schedule_cache (ScheduleCache): Optional schedule cache shared across groups.
+
+    Returns:
+    pandas.DataFrame: The priced trades in input order.
+    """
+    schedule_cache = schedule_cache if schedule_cache is not None else ScheduleCache()
+    trade_dates = parse_trade_dates(transactions_df['Trade Time'])
+    undated = trade_dates.isna().to_numpy()
+    if undated.any():
+        logging.warning(f"No parseable 'Trade Time'; skipping {int(undated.sum())} trades "
+                        f"(first row labels: {transactions_df.index[undated][:10].tolist()})")
+        get_run_metrics().count('skipped', undated.sum())
+    dated = transactions_df[~undated]
+    priced = []
+    for (trade_date, currency), group in dated.groupby([trade_dates[~undated], 'Curr'], sort=True, dropna=False):
+        if currency not in CONVENTIONS:
+            logging.warning(f"Unsupported currency {currency}; skipping {len(group)} trades")
+            get_run_metrics().count('skipped', len(group))
+            continue
+        convention = get_convention(currency)
+        evaluation_date = set_evaluation_date(to_ql_date(trade_date), convention)
+        index, handle = currency_index(convention, fixings_dir, evaluation_date)
+        yield_curve = curve_cache.get(convention, evaluation_date)
+        if yield_curve is None:
+            logging.warning(f"No {currency} curve for {trade_date:%Y-%m-%d}; skipping {len(group)} trades")
+            get_run_metrics().count('skipped', len(group))
+            continue
+        handle.linkTo(yield_curve)
+
+        pricer = make_pricer(backend, yield_curve, index, convention, schedule_cache,
+                             curve_cache.nodes(convention, evaluation_date))
+        priced.append(pricer.price(group))
+    logging.info(f"Curve cache: {curve_cache.stats()}; schedule cache: {schedule_cache.stats()}")
+    if backend == 'vectorized':
+        logging.info(f"Forward cache: {get_forward_cache().stats()}")
+
+    return combine_priced(priced, transactions_df.columns)
+
+
+def combine_priced(priced, columns):
+    """
+    Concatenate priced groups back into input order.
+    """
+    priced = [df for df in priced if not df.empty]
+    if not priced:
+        return pd.DataFrame(columns=list(columns) + ['Fair Rate', 'Difference'])
+    return pd.concat(priced).sort_index()
@@ -0,0 +1,81 @@
+# Name: schedules.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: LRU-bounded memoization of ql.Schedule construction. SDR trades cluster on
+# the same (Effective, Maturity, PF) combinations, so most schedules are built many times.
+
+from collections import OrderedDict
+
+import QuantLib as ql
+
+
+class ScheduleCache:
+    """
+    Caches ql.Schedule objects keyed on (effective, maturity, tenor, calendar, convention, rule, end-of-month).
+
+    Parameters:
+    maxsize (int): Maximum number of schedules kept; the least recently used entry is evicted first.
+    """
+
+    def __init__(self, maxsize=50000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._schedules = OrderedDict()
+
+    def __len__(self):
+        return len(self._schedules)
+
+    def get(self, effective_date, maturity_date, tenor, calendar, convention, rule, end_of_month):
+        """
+        Return the schedule for the given terms, building it on a miss.
+
+        Parameters:
+        effective_date (ql.Date): Schedule start date.
+        maturity_date (ql.Date): Schedule end date.
+        tenor (ql.Period): Coupon tenor.
+        calendar (ql.Calendar): Adjustment calendar.
+        convention (int): Business day convention for both accrual and termination dates.
+        rule (int): ql.DateGeneration rule.
+        end_of_month (bool): End-of-month flag.
+
+        Returns:
+        ql.Schedule: The (possibly shared) schedule.
+        """
+        key = (effective_date.serialNumber(), maturity_date.serialNumber(),
+               tenor.length(), tenor.units(), calendar.name(), convention, rule, end_of_month)
+        schedule = self._schedules.get(key)
+        if schedule is not None:
+            self.hits += 1
+            self._schedules.move_to_end(key)
+            return schedule
+
+        self.misses += 1
+        schedule = ql.Schedule(effective_date,
+                               maturity_date,
+                               tenor,
+                               calendar,
+                               convention,
+                               convention,
+                               rule,
+                               end_of_month)
+        self._schedules[key] = schedule
+        if len(self._schedules) > self.maxsize:
+            self._schedules.popitem(last=False)
+        return schedule
+
+    def stats(self):
+        """
+        Returns:
+        dict: Hit and miss counts, hit rate and current size.
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._schedules)}
+
+    def clear(self):
+        self._schedules.clear()
+        self.hits = 0
+        self.misses = 0
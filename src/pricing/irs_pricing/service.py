@@ -0,0 +1,394 @@
+# Name: service.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Resident pricing service. A PricingService keeps bootstrapped curves, loaded
+# fixings, schedules and pricers in memory per (currency, evaluation date) and serves batches
+# of trades over HTTP on localhost or a Unix socket, so ad-hoc requests skip the interpreter
+# start, the QuantLib import, the curve sheet parse and the bootstrap. PricingClient is the
+# notebook side.
+
+import argparse
+import http.client
+import json
+import logging
+import math
+import os
+import signal
+import socket
+import socketserver
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import numpy as np
+import pandas as pd
+
+from .cli import parse_curve_argument
+from .conventions import CONVENTIONS, get_convention
+from .curve_store import CurveStore
+from .curves import CurveCache, curve_file_loader
+from .dates import parse_trade_dates, to_ql_date
+from .fixings import load_fixings
+from .metrics import get_run_metrics
+from .pricer import currency_index, get_pricer_class, set_evaluation_date
+from .schedules import ScheduleCache
+from .validation import NUMERIC_COLUMNS, screen_trades
+
+BAD_TRADE_TIME = 'BAD_TRADE_TIME'
+UNSUPPORTED_CURRENCY = 'UNSUPPORTED_CURRENCY'
+NO_CURVE = 'NO_CURVE'
+PRICING_FAILED = 'PRICING_FAILED'
+
+
+class PricingService:
+    """
+    Prices batches of trades against curves kept warm in memory.
+
+    Curves are loaded from the quote file templates and bootstrapped on first use of a
+    (currency, evaluation date), then served from a CurveCache; the pricers of each pair are kept
+    as well, with their index, schedules and forwards. The vectorized backend has a fixed cost
+    of some milliseconds per call, so groups smaller than `small_batch` trades are priced
+    through QuantLib swaps instead. Requests are handled one at a time, since QuantLib's
+    evaluation date and fixings are process-wide.
+
+    Parameters:
+    templates (dict): Curve file path templates keyed by currency; see files.format_path.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    cache_size (int): Number of curves, and of pricers, kept in memory.
+    curve_store (CurveStore): Optional persistent store of bootstrapped curves.
+    small_batch (int): Groups of fewer trades use the 'quantlib' backend.
+    """
+
+    def __init__(self, templates, fixings_dir, backend='vectorized', cache_size=64, curve_store=None,
+                 small_batch=50):
+        self.templates = templates
+        self.fixings_dir = fixings_dir
+        self.backend = backend
+        self.cache_size = cache_size
+        self.small_batch = small_batch
+        self.curve_cache = CurveCache(curve_file_loader(templates), maxsize=cache_size, curve_store=curve_store)
+        self.schedule_cache = ScheduleCache()
+        self.requests = 0
+        self.trades = 0
+        self._pricers = OrderedDict()
+
+    def _pricer(self, convention, evaluation_date, backend=None):
+        """
+        Return the cached pricer of a currency and adjusted evaluation date, or None if there is
+        no curve. The global evaluation date must already be `evaluation_date`.
+        """
+        backend = backend or self.backend
+        key = (convention.currency, evaluation_date.serialNumber())
+        if key in self._pricers:
+            self._pricers.move_to_end(key)
+            yield_curve, index, pricers = self._pricers[key]
+            # Another date may have moved the index's process-wide fixings since
+            load_fixings(index, convention, self.fixings_dir, evaluation_date)
+        else:
+            index, handle = currency_index(convention, self.fixings_dir, evaluation_date)
+            yield_curve = self.curve_cache.get(convention, evaluation_date)
+            if yield_curve is None:
+                return None
+            handle.linkTo(yield_curve)
+            pricers = {}
+            self._pricers[key] = (yield_curve, index, pricers)
+            if len(self._pricers) > self.cache_size:
+                self._pricers.popitem(last=False)
+
+        if backend not in pricers:
+            pricers[backend] = get_pricer_class(backend)(yield_curve, index, convention, self.schedule_cache)
+        return pricers[backend]
+
+    def warm(self, dates):
+        """
+        Bootstrap the curves of every templated currency for some evaluation dates in advance.
+        """
+        for date in dates:
+            for currency in self.templates:
+                convention = get_convention(currency)
+                self._pricer(convention, set_evaluation_date(to_ql_date(pd.Timestamp(date)), convention))
+
+    def price(self, transaction_df, evaluation_date=None):
+        """
+        Price a batch of SDR trades.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades, any currencies.
+        evaluation_date (str or pandas.Timestamp): Evaluation date of every trade; by default
+            each trade is priced on the date of its 'Trade Time', as with --by_trade_date.
+
+        Returns:
+        tuple: (fair rates in percent, differences in bps, reasons) as arrays aligned to the
+        input rows. Unpriced trades are NaN, with the reject reason code, BAD_TRADE_TIME (no
+        parseable 'Trade Time' to price on), UNSUPPORTED_CURRENCY (a missing 'Curr' included),
+        NO_CURVE or, if the pricer itself failed on them, PRICING_FAILED as reason; priced trades
+        have None.
+        """
+        transaction_df = transaction_df.reset_index(drop=True)
+        fair_rate = np.full(len(transaction_df), np.nan)
+        difference = np.full(len(transaction_df), np.nan)
+        reasons = np.full(len(transaction_df), None, dtype=object)
+
+        accepted, rejects = screen_trades(transaction_df)
+        reasons[rejects.index] = rejects['Reason'].to_numpy()
+        if evaluation_date is None:
+            dates = parse_trade_dates(accepted['Trade Time'])
+        else:
+            dates = pd.Series(pd.Timestamp(evaluation_date).normalize(), index=accepted.index)
+        currencies = accepted['Curr'].astype('string').str.upper()
+        undated = dates.isna()
+        unsupported = ~undated & ~currencies.isin(CONVENTIONS)
+        reasons[accepted.index[undated]] = BAD_TRADE_TIME
+        reasons[accepted.index[unsupported]] = UNSUPPORTED_CURRENCY
+        priceable = ~(undated | unsupported)
+
+        for (date, currency), group in accepted[priceable].groupby([dates[priceable], currencies[priceable]],
+                                                                     sort=True):
+            convention = get_convention(currency)
+            backend = 'quantlib' if len(group) < self.small_batch else self.backend
+            pricer = self._pricer(convention, set_evaluation_date(to_ql_date(date), convention), backend)
+            if pricer is None:
+                reasons[group.index] = NO_CURVE
+                continue
+            fair_rate[group.index], difference[group.index] = pricer.price_arrays(group)
+            failed = group.index[np.isnan(fair_rate[group.index])]
+            reasons[failed] = PRICING_FAILED
+
+        self.requests += 1
+        self.trades += len(transaction_df)
+        return fair_rate, difference, reasons
+
+    def stats(self):
+        return {'requests': self.requests,
+                'trades': self.trades,
+                'backend': self.backend,
+                'curve_cache': self.curve_cache.stats(),
+                'pricers': len(self._pricers),
+                'schedule_cache': self.schedule_cache.stats(),
+                'metrics': get_run_metrics().to_dict()}
+
+
+def _json_number(value):
+    return None if math.isnan(value) else float(value)
+
+
+class PricingRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP front end of a PricingService, found on the server's `service` attribute.
+
+    GET /health and GET /stats report on the service. POST /price takes a JSON object with
+    'trades', a list of SDR trade records (dates as MM/DD/YYYY strings), and an optional
+    'evaluation_date' (YYYY-MM-DD); it returns 'fair_rate', 'difference' and 'reason' lists
+    aligned to the trades, and the server-side 'elapsed_ms'.
+    """
+
+    # Buffer the reply so headers and body go out in one write; small replies would
+    # otherwise wait on the client's delayed ACK
+    wbufsize = -1
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'local'
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} {format % args}")
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._reply(200, {'status': 'ok'})
+        elif self.path == '/stats':
+            self._reply(200, self.server.service.stats())
+        else:
+            self._reply(404, {'error': f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/price':
+            self._reply(404, {'error': f"Unknown path {self.path}"})
+            return
+        start = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            transaction_df = pd.DataFrame.from_records(request['trades'])
+            for column in NUMERIC_COLUMNS:
+                if column in transaction_df:
+                    transaction_df[column] = pd.to_numeric(transaction_df[column], errors='coerce')
+            fair_rate, difference, reasons = self.server.service.price(transaction_df,
+                                                                       request.get('evaluation_date'))
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {'error': f"Bad pricing request: {e}"})
+            return
+        except Exception as e:
+            logging.exception('Pricing request failed')
+            self._reply(500, {'error': str(e)})
+            return
+        self._reply(200, {'fair_rate': [_json_number(value) for value in fair_rate],
+                          'difference': [_json_number(value) for value in difference],
+                          'reason': reasons.tolist(),
+                          'elapsed_ms': (time.perf_counter() - start) * 1000})
+
+
+class UnixHTTPServer(socketserver.UnixStreamServer):
+    """
+    HTTPServer equivalent listening on a Unix socket; a stale socket file is replaced.
+    """
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+
+def make_server(service, host='127.0.0.1', port=8765, socket_path=None):
+    """
+    Create the HTTP server of a PricingService on localhost or, given `socket_path`, on a Unix socket.
+
+    Returns:
+    socketserver.BaseServer: The server; call serve_forever() to run it.
+    """
+    if socket_path:
+        server = UnixHTTPServer(socket_path, PricingRequestHandler)
+    else:
+        server = HTTPServer((host, port), PricingRequestHandler)
+    server.service = service
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class PricingClient:
+    """
+    Client of a running pricing service, e.g. from a notebook.
+
+    Parameters:
+    address (str): 'host:port' of a localhost service, or the path of its Unix socket.
+    timeout (float): Socket timeout in seconds.
+    """
+
+    def __init__(self, address='127.0.0.1:8765', timeout=300):
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self):
+        host, sep, port = self.address.rpartition(':')
+        if sep and port.isdigit():
+            return http.client.HTTPConnection(host, int(port), timeout=self.timeout)
+        return _UnixHTTPConnection(self.address, timeout=self.timeout)
+
+    def _request(self, method, path, body=None):
+        connection = self._connection()
+        try:
+            payload = json.dumps(body).encode() if body is not None else None
+            connection.request(method, path, payload, {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            reply = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise RuntimeError(f"Pricing service error {response.status}: {reply.get('error')}")
+        return reply
+
+    def stats(self):
+        return self._request('GET', '/stats')
+
+    def price(self, transaction_df, evaluation_date=None):
+        """
+        Price SDR trades on the service.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades.
+        evaluation_date (str): Evaluation date (YYYY-MM-DD) of every trade; each trade's
+            'Trade Time' date by default.
+
+        Returns:
+        pandas.DataFrame: Every trade, in input order, with 'Fair Rate' (percent), 'Difference'
+        (bps) and 'Reason' columns. Unpriced trades keep NaN prices and the service's reason
+        code (a reject reason, BAD_TRADE_TIME, UNSUPPORTED_CURRENCY, NO_CURVE or
+        PRICING_FAILED); priced trades have no reason.
+        """
+        records = transaction_df.copy()
+        for column in ('Effective', 'Maturity'):
+            if column in records and pd.api.types.is_datetime64_any_dtype(records[column]):
+                records[column] = records[column].dt.strftime('%m/%d/%Y')
+        if 'Trade Time' in records:
+            records['Trade Time'] = records['Trade Time'].astype(str)
+
+        # to_json writes missing values as null
+        body = {'trades': json.loads(records.to_json(orient='records'))}
+        if evaluation_date is not None:
+            body['evaluation_date'] = f"{pd.Timestamp(evaluation_date):%Y-%m-%d}"
+        reply = self._request('POST', '/price', body)
+        return transaction_df.assign(**{'Fair Rate': np.array(reply['fair_rate'], dtype=float),
+                                        'Difference': np.array(reply['difference'], dtype=float),
+                                        'Reason': reply['reason']})
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Serve swap pricing from curves kept in memory')
+    parser.add_argument('--curve', help='Yield curve file template for a currency, as CCY=template, '
+                        'e.g. USD=curves/usd_{date:%%m%%d%%Y}.xlsx (repeatable)',
+                        type=parse_curve_argument, action='append', required=True)
+    parser.add_argument('--fixings_dir', help='Directory with historical fixings workbooks',
+                        default='data/raw/historical_fixings')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--socket', default=None, help='Listen on this Unix socket instead of a port')
+    parser.add_argument('--backend', choices=['quantlib', 'vectorized'], default='vectorized',
+                        help='Pricing backend')
+    parser.add_argument('--cache_size', type=int, default=64,
+                        help='Number of (currency, date) curves and pricers kept in memory')
+    parser.add_argument('--curve_store', default=None,
+                        help='Directory of bootstrapped curves reused across runs when the quotes are unchanged')
+    parser.add_argument('--small_batch', type=int, default=50,
+                        help='Price groups of fewer trades through QuantLib swaps, which start faster')
+    parser.add_argument('--preload', action='append', default=[],
+                        help='Bootstrap every curve of this evaluation date (YYYY-MM-DD) at startup (repeatable)')
+    parser.add_argument('--log_level', default='INFO', help='Logging level')
+    return parser.parse_args(argv)
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    logging.basicConfig(level=args.log_level, format='%(asctime)s %(levelname)s %(message)s')
+
+    curve_store = CurveStore(args.curve_store) if args.curve_store else None
+    service = PricingService(dict(args.curve), args.fixings_dir, args.backend, args.cache_size, curve_store,
+                             args.small_batch)
+    service.warm(args.preload)
+    server = make_server(service, args.host, args.port, args.socket)
+    logging.info(f"Pricing service listening on {args.socket or f'{args.host}:{args.port}'}")
+    # Shut down cleanly on SIGTERM too, removing the socket file
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
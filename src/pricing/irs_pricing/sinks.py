@@ -0,0 +1,223 @@
+# Name: sinks.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Output sinks for priced trades. The format is chosen from the file extension or
+# an explicit name. CSV, Parquet and Feather sinks append chunk by chunk; Excel buffers the
+# chunks and writes once on close. Parquet and Feather need pyarrow.
+
+import os
+
+import pandas as pd
+
+from .validation import NUMERIC_COLUMNS, TEXT_COLUMNS
+
+# Written as float64 whatever the first chunk holds, e.g. whole-number notionals
+FLOAT_COLUMNS = NUMERIC_COLUMNS + ['Fair Rate', 'Difference']
+
+
+def _arrow_schema(df):
+    """
+    Arrow schema for a Parquet or Feather file, from its first chunk.
+
+    Later chunks are converted to this schema, so it must not depend on what the first chunk
+    happens to hold: numeric FLOAT_COLUMNS are float64, and TEXT_COLUMNS (unless read as dates)
+    and any other column that is all null in the first chunk are strings.
+
+    Parameters:
+    df (pandas.DataFrame): The first chunk.
+
+    Returns:
+    pyarrow.Schema: The file schema.
+    """
+    import pyarrow as pa
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(schema):
+        if field.name in FLOAT_COLUMNS:
+            if pa.types.is_integer(field.type) or pa.types.is_null(field.type):
+                schema = schema.set(i, field.with_type(pa.float64()))
+        elif pa.types.is_null(field.type) or (field.name in TEXT_COLUMNS and not pa.types.is_temporal(field.type)):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+
+class Sink:
+    """
+    Base class of the output sinks. Use as a context manager, or call close() when done.
+
+    Parameters:
+    path (str): Output file path.
+    """
+
+    # False for sinks that hold every chunk in memory until close()
+    incremental = True
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+
+    def write(self, df):
+        """
+        Append a DataFrame of results (its index is not written).
+        """
+        self.rows += len(df)
+        self._write(df)
+
+    def _write(self, df):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvSink(Sink):
+    def __init__(self, path):
+        super().__init__(path)
+        self._header = True
+
+    def _write(self, df):
+        df.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        if self._header:
+            pd.DataFrame().to_csv(self.path, index=False)
+
+
+class ParquetSink(Sink):
+    def __init__(self, path):
+        super().__init__(path)
+        import pyarrow.parquet as pq
+        self._pq = pq
+        self._writer = None
+
+    def _write(self, df):
+        import pyarrow as pa
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, _arrow_schema(df))
+        self._writer.write_table(pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self.rows == 0:
+            pd.DataFrame().to_parquet(self.path)
+
+
+class FeatherSink(Sink):
+    def __init__(self, path):
+        super().__init__(path)
+        self._writer = None
+        self._schema = None
+
+    def _write(self, df):
+        import pyarrow as pa
+        if self._writer is None:
+            self._schema = _arrow_schema(df)
+            # Compressed like DataFrame.to_feather
+            compression = 'lz4' if pa.Codec.is_available('lz4') else None
+            self._writer = pa.ipc.new_file(self.path, self._schema,
+                                           options=pa.ipc.IpcWriteOptions(compression=compression))
+        self._writer.write_table(pa.Table.from_pandas(df, schema=self._schema, preserve_index=False))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self.rows == 0:
+            pd.DataFrame().to_feather(self.path)
+
+
+class _BufferedSink(Sink):
+    incremental = False
+
+    def __init__(self, path):
+        super().__init__(path)
+        self._chunks = []
+
+    def _write(self, df):
+        self._chunks.append(df)
+
+    def close(self):
+        if self._chunks is None:
+            return
+        df = pd.concat(self._chunks, ignore_index=True) if self._chunks else pd.DataFrame()
+        self._chunks = None
+        self._flush(df.reset_index(drop=True))
+
+    def _flush(self, df):
+        raise NotImplementedError
+
+
+class ExcelSink(_BufferedSink):
+    def _flush(self, df):
+        df.to_excel(self.path, index=False)
+
+
+SINKS = {
+    'csv': CsvSink,
+    'parquet': ParquetSink,
+    'feather': FeatherSink,
+    'excel': ExcelSink,
+}
+
+EXTENSIONS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+}
+
+
+def register_sink(name, sink_class, extensions=()):
+    """
+    Register an additional sink under a format name and optional file extensions.
+    """
+    SINKS[name] = sink_class
+    for extension in extensions:
+        EXTENSIONS[extension.lower()] = name
+
+
+def sink_format(path, fmt=None):
+    """
+    Resolve the output format from an explicit name or the file extension.
+    """
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in EXTENSIONS:
+            raise ValueError(f"Cannot infer output format from '{path}'; use one of {sorted(SINKS)}")
+        fmt = EXTENSIONS[extension]
+    if fmt not in SINKS:
+        raise ValueError(f"Unknown output format '{fmt}'; use one of {sorted(SINKS)}")
+    return fmt
+
+
+def open_sink(path, fmt=None):
+    """
+    Open a sink for `path`.
+
+    Parameters:
+    path (str): Output file path.
+    fmt (str): 'csv', 'parquet', 'feather' or 'excel'; inferred from the extension if omitted.
+
+    Returns:
+    Sink: The opened sink.
+    """
+    return SINKS[sink_format(path, fmt)](path)
+
+
+def write_results(df, path, fmt=None):
+    """
+    Write a complete result set through the sink for `path`.
+    """
+    with open_sink(path, fmt) as sink:
+        sink.write(df)
@@ -0,0 +1,399 @@
+# Name: streaming.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Streaming pricing of transaction files larger than memory. Trades are read in
+# chunks from CSV or Parquet, priced against curves and indexes built once per currency, and
+# appended to the output sink chunk by chunk, so peak memory is bounded by the chunk size.
+# A live mode follows an append-only CSV or JSONL feed instead, pricing trades as they arrive
+# and hot-swapping curve quotes when a quote file changes.
+
+import io
+import json
+import logging
+import os
+import time
+
+import pandas as pd
+import QuantLib as ql
+
+from .conventions import get_convention
+from .curves import WarmBootstrapper, bootstrap_curve
+from .excel import read_excel
+from .forwards import get_forward_cache
+from .metrics import count_trades, get_run_metrics, stage
+from .pricer import combine_priced, currency_index, get_pricer_class, set_evaluation_date
+from .schedules import ScheduleCache
+from .sinks import CsvSink, open_sink
+from .validation import NUMERIC_COLUMNS, TEXT_COLUMNS, screen_trades
+
+# Transaction file extensions read_transaction_chunks can stream
+CHUNKED_EXTENSIONS = ('.csv', '.parquet', '.pq')
+
+
+def read_transaction_chunks(path, chunksize):
+    """
+    Iterate over a CSV or Parquet transaction file in chunks.
+
+    Row labels continue across chunks, so they match the row positions of the whole file.
+
+    Parameters:
+    path (str): A .csv or .parquet/.pq file.
+    chunksize (int): Number of rows per chunk.
+
+    Returns:
+    iterator: pandas DataFrames of at most `chunksize` rows.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        header = pd.read_csv(path, nrows=0).columns
+        dtype = {column: str for column in TEXT_COLUMNS if column in header}
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=dtype)
+    elif extension in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+    else:
+        raise ValueError(f"Streaming needs a CSV or Parquet transaction file, got '{path}'")
+
+
+class StreamingPricer:
+    """
+    Prices chunks of a mixed-currency transaction file against fixed curves.
+
+    Each currency's curve, index (with its fixings) and pricer are built on the first chunk
+    that contains the currency and reused for every later chunk.
+
+    Parameters:
+    yield_curves (dict): Curve quote sheets keyed by currency code.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    curve_store (CurveStore): Optional persistent store of bootstrapped curves.
+    """
+
+    def __init__(self, yield_curves, evaluation_date, fixings_dir, backend='quantlib', curve_store=None):
+        self.yield_curves = yield_curves
+        self.evaluation_date = evaluation_date
+        self.fixings_dir = fixings_dir
+        self.backend = backend
+        self.curve_store = curve_store
+        self.schedule_cache = ScheduleCache()
+        self._pricers = {}
+        self._skipped = set()
+
+    def _pricer(self, currency):
+        if currency not in self._pricers:
+            convention = get_convention(currency)
+            evaluation_date = set_evaluation_date(self.evaluation_date, convention)
+            index, handle = currency_index(convention, self.fixings_dir, evaluation_date)
+            yield_curve = bootstrap_curve(self.yield_curves[currency], convention, evaluation_date,
+                                          self.curve_store)
+            handle.linkTo(yield_curve)
+            pricer = get_pricer_class(self.backend)(yield_curve, index, convention, self.schedule_cache)
+            self._pricers[currency] = (evaluation_date, pricer)
+        evaluation_date, pricer = self._pricers[currency]
+        ql.Settings.instance().evaluationDate = evaluation_date
+        return pricer
+
+    def price(self, transaction_df):
+        """
+        Price one chunk.
+
+        Returns:
+        pandas.DataFrame: The priced trades of the chunk in input order.
+        """
+        priced = []
+        for currency, group in transaction_df.groupby('Curr', sort=False):
+            if currency not in self.yield_curves:
+                if currency not in self._skipped:
+                    logging.warning(f"No yield curve supplied for {currency}; skipping its trades")
+                    self._skipped.add(currency)
+                get_run_metrics().count('skipped', len(group))
+                continue
+            priced.append(self._pricer(currency).price(group))
+        return combine_priced(priced, transaction_df.columns)
+
+
+def price_stream(transaction_file, output_file, yield_curves, evaluation_date, fixings_dir, chunksize=100000,
+                 backend='quantlib', output_format=None, rejects_file=None, curve_store=None):
+    """
+    Price a CSV or Parquet transaction file chunk by chunk, appending to the output as it goes.
+
+    Parameters:
+    transaction_file (str): SDR trades as .csv or .parquet.
+    output_file (str): Output path; the sink is chosen from its extension or `output_format`.
+    yield_curves (dict): Curve quote sheets keyed by currency code.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    chunksize (int): Number of trades read and priced at a time.
+    backend (str): 'quantlib' or 'vectorized'.
+    output_format (str): Optional sink name overriding the extension.
+    rejects_file (str): Optional CSV receiving the rejected trades with their reason code.
+    curve_store (CurveStore): Optional persistent store of bootstrapped curves.
+
+    Returns:
+    tuple: (number of trades read, number priced, number rejected).
+    """
+    pricer = StreamingPricer(yield_curves, evaluation_date, fixings_dir, backend, curve_store)
+    read = priced_count = rejected = 0
+    rejects_sink = CsvSink(rejects_file) if rejects_file else None
+    try:
+        with open_sink(output_file, output_format) as sink:
+            for chunk in read_transaction_chunks(transaction_file, chunksize):
+                accepted, rejects = screen_trades(chunk)
+                priced = pricer.price(accepted)
+                with stage('output_write'):
+                    sink.write(priced)
+                    if rejects_sink is not None:
+                        rejects_sink.write(rejects.rename_axis('Row').reset_index())
+                count_trades(len(rejects), priced)
+                read += len(chunk)
+                priced_count += len(priced)
+                rejected += len(rejects)
+                logging.info(f"Priced {priced_count} of {read} trades read")
+    finally:
+        if rejects_sink is not None:
+            rejects_sink.close()
+    logging.info(f"Schedule cache: {pricer.schedule_cache.stats()}")
+    if backend == 'vectorized':
+        logging.info(f"Forward cache: {get_forward_cache().stats()}")
+    return read, priced_count, rejected
+
+
+class TradeFeed:
+    """
+    Follows an append-only CSV or JSONL trade file.
+
+    Each poll returns the complete lines appended since the previous one; a trailing line
+    still being written is left for the next poll. If the file shrinks it is taken to have
+    been replaced and is read again from the start. Row labels continue across polls.
+
+    Parameters:
+    path (str): A .csv file with a header line, or a .jsonl/.ndjson file of trade objects.
+    from_start (bool): Return the trades already in the file on the first poll; otherwise
+        only trades appended after the feed is opened.
+    """
+
+    def __init__(self, path, from_start=True):
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in ('.csv', '.jsonl', '.ndjson'):
+            raise ValueError(f"Following needs a CSV or JSONL transaction file, got '{path}'")
+        self.path = path
+        self.jsonl = extension != '.csv'
+        self.rows = 0
+        self._offset = 0
+        self._header = None
+        if not from_start and os.path.exists(path):
+            self._offset = os.path.getsize(path)
+            if not self.jsonl:
+                with open(path, 'rb') as f:
+                    self._header = f.readline().decode().rstrip('\r\n')
+
+    def _read_lines(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return ''
+        if size < self._offset:
+            logging.warning(f"{self.path} shrank; reading it again from the start")
+            self._offset = 0
+            self._header = None
+        if size == self._offset:
+            return ''
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+        end = data.rfind(b'\n') + 1
+        self._offset += end
+        return data[:end].decode()
+
+    def poll(self):
+        """
+        Returns:
+        pandas.DataFrame: The trades appended since the last poll, or None if there are none.
+        """
+        text = self._read_lines()
+        if self.jsonl:
+            records = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logging.warning(f"Skipping malformed line in {self.path}: {line[:80]}")
+            if not records:
+                return None
+            trades = pd.DataFrame.from_records(records)
+        else:
+            if self._header is None:
+                if not text:
+                    return None
+                header, _, text = text.partition('\n')
+                self._header = header.rstrip('\r')
+            if not text.strip():
+                return None
+            columns = pd.read_csv(io.StringIO(self._header), nrows=0).columns
+            dtype = {column: str for column in TEXT_COLUMNS if column in columns}
+            trades = pd.read_csv(io.StringIO(f"{self._header}\n{text}"), dtype=dtype)
+        for column in NUMERIC_COLUMNS:
+            if column in trades:
+                trades[column] = pd.to_numeric(trades[column], errors='coerce')
+        trades.index = pd.RangeIndex(self.rows, self.rows + len(trades))
+        self.rows += len(trades)
+        return trades
+
+
+class LivePricer(StreamingPricer):
+    """
+    Prices trades against curves that follow their quote files.
+
+    refresh() reloads every quote file whose size or modification time changed. While a
+    currency's quote sheet lists the same instruments its WarmBootstrapper only resets the
+    SimpleQuote values of the live curve and re-solves from the previous nodes; a different
+    instrument set is bootstrapped from scratch. If the new quotes fail to bootstrap, the
+    previous curve stays in use.
+
+    Parameters:
+    curve_files (dict): Curve quote file paths keyed by currency code.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    """
+
+    def __init__(self, curve_files, evaluation_date, fixings_dir, backend='quantlib'):
+        super().__init__({}, evaluation_date, fixings_dir, backend)
+        self.curve_files = curve_files
+        self.bootstrappers = {}
+        self._indexes = {}
+        self._stamps = {}
+
+    def _pricer(self, currency):
+        if currency not in self._pricers:
+            self._bootstrap(currency)
+        evaluation_date, pricer = self._pricers[currency]
+        ql.Settings.instance().evaluationDate = evaluation_date
+        return pricer
+
+    def _bootstrap(self, currency):
+        convention = get_convention(currency)
+        evaluation_date = set_evaluation_date(self.evaluation_date, convention)
+        if currency not in self._indexes:
+            self._indexes[currency] = currency_index(convention, self.fixings_dir, evaluation_date)
+            self.bootstrappers[currency] = WarmBootstrapper(convention)
+        index, handle = self._indexes[currency]
+        yield_curve = bootstrap_curve(self.yield_curves[currency], convention, evaluation_date,
+                                      bootstrapper=self.bootstrappers[currency])
+        handle.linkTo(yield_curve)
+        pricer = get_pricer_class(self.backend)(yield_curve, index, convention, self.schedule_cache)
+        self._pricers[currency] = (evaluation_date, pricer)
+
+    def refresh(self):
+        """
+        Reload and re-bootstrap the curves whose quote files changed.
+
+        Returns:
+        list: The currencies whose curves were updated.
+        """
+        updated = []
+        for currency, path in self.curve_files.items():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if self._stamps.get(currency) == stamp:
+                continue
+            try:
+                with stage('excel_read'):
+                    yield_curve_df = read_excel(path)
+            except Exception as e:
+                # Most likely still being written; retried on the next refresh
+                logging.warning(f"Could not read {currency} quotes {path}: {e}")
+                continue
+            self._stamps[currency] = stamp
+
+            previous = self.yield_curves.get(currency)
+            self.yield_curves[currency] = yield_curve_df
+            try:
+                self._bootstrap(currency)
+            except Exception:
+                logging.exception(f"Failed to bootstrap the new {currency} quotes from {path}; "
+                                  f"keeping the previous curve")
+                self.bootstrappers[currency] = WarmBootstrapper(get_convention(currency))
+                if previous is None:
+                    del self.yield_curves[currency]
+                else:
+                    self.yield_curves[currency] = previous
+                continue
+            record = self.bootstrappers[currency].records[-1]
+            logging.info(f"Updated the {currency} curve from {path} ({'warm' if record['Warm Start'] else 'cold'}, "
+                         f"{record['Solve Seconds'] * 1000:.1f} ms)")
+            updated.append(currency)
+        return updated
+
+
+def follow_stream(transaction_file, output_file, curve_files, evaluation_date, fixings_dir, backend='quantlib',
+                  output_format=None, rejects_file=None, poll_interval=1.0, idle_timeout=None, from_start=True):
+    """
+    Tail an append-only trade file and price new trades as they arrive.
+
+    Every poll reloads changed curve quote files first, then prices the trades appended since
+    the previous poll and appends them to the output. A CSV output can be read while this runs;
+    other sinks are complete only once it returns.
+
+    Parameters:
+    transaction_file (str): SDR trades as .csv or .jsonl, appended to by another process.
+    output_file (str): Output path; the sink is chosen from its extension or `output_format`.
+    curve_files (dict): Curve quote file paths keyed by currency code.
+    evaluation_date (ql.Date): The unadjusted evaluation date.
+    fixings_dir (str): Directory holding the historical fixings workbooks.
+    backend (str): 'quantlib' or 'vectorized'.
+    output_format (str): Optional sink name overriding the extension.
+    rejects_file (str): Optional CSV receiving the rejected trades with their reason code.
+    poll_interval (float): Seconds to wait when no new trades arrived.
+    idle_timeout (float): Stop after this many seconds without new trades; run until
+        interrupted if None.
+    from_start (bool): Also price the trades already in the file when it is opened.
+
+    Returns:
+    tuple: (number of trades read, number priced, number rejected).
+    """
+    feed = TradeFeed(transaction_file, from_start)
+    pricer = LivePricer(curve_files, evaluation_date, fixings_dir, backend)
+    read = priced_count = rejected = 0
+    idle_since = time.monotonic()
+    rejects_sink = CsvSink(rejects_file) if rejects_file else None
+    try:
+        with open_sink(output_file, output_format) as sink:
+            while True:
+                pricer.refresh()
+                trades = feed.poll()
+                if trades is None:
+                    if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                idle_since = time.monotonic()
+                accepted, rejects = screen_trades(trades)
+                priced = pricer.price(accepted)
+                with stage('output_write'):
+                    sink.write(priced)
+                    if rejects_sink is not None:
+                        rejects_sink.write(rejects.rename_axis('Row').reset_index())
+                count_trades(len(rejects), priced)
+                read += len(trades)
+                priced_count += len(priced)
+                rejected += len(rejects)
+                logging.info(f"Priced {len(priced)} new trades; {priced_count} of {read} so far")
+    except KeyboardInterrupt:
+        logging.info(f"Stopped following {transaction_file}")
+    finally:
+        if rejects_sink is not None:
+            rejects_sink.close()
+    return read, priced_count, rejected
@@ -0,0 +1,151 @@
+# Name: synthetic.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Deterministic synthetic inputs for benchmarks and tests without the Bloomberg
+# and SDR workbooks: curve quote sheets in the Tenor/Description/Yield/Source/Update layout and
+# transaction sheets in the SDR column layout, for every supported currency.
+
+import numpy as np
+import pandas as pd
+
+from .calendars import add_months
+from .dates import EPOCH_SERIAL
+
+CURVE_COLUMNS = ['Tenor', 'Description', 'Yield', 'Source', 'Update', 'CUSIP']
+TRANSACTION_COLUMNS = ['Trade Time', 'Type', 'Clr', 'Curr', 'Effective', 'Maturity', 'Rate 1', 'Leg 1', 'Rate 2',
+                       'Leg 2', 'Not.', 'PF 1', 'PF 2']
+
+SWAP_YEARS = (2, 3, 4, 5, 7, 10, 12, 15, 20, 25, 30)
+
+# Per currency: deposit (tenor, description) rows, swap description and CUSIP templates, short and
+# long end of the curve in percent, and the (fixed, float) payment frequencies of its SDR trades
+CURVE_INSTRUMENTS = {
+    'USD': {'deposits': [('1M', 'US0001M Index'), ('3M', 'US0003M Index'), ('6M', 'US0006M Index')],
+            'swap': 'USSWAP{years} Curncy', 'cusip': None, 'levels': (0.30, 3.60), 'frequencies': ('6M', '3M')},
+    'CAD': {'deposits': [('1M', 'CDOR01 Index'), ('3M', 'CDOR03 Index')],
+            'swap': 'CDSW{years} Curncy', 'cusip': None, 'levels': (1.25, 3.10), 'frequencies': ('6M', '3M')},
+    'EUR': {'deposits': [('3M', 'EUR003M Index'), ('6M', 'EUR006M Index')],
+            'swap': 'EUR SWAP ANN {years}Y', 'cusip': 'EUSA{years}', 'levels': (0.20, 2.40),
+            'frequencies': ('1Y', '6M')},
+    'GBP': {'deposits': [('3M', 'BP0003M Index'), ('6M', 'BP0006M Index')],
+            'swap': 'BPSW{years} Curncy', 'cusip': None, 'levels': (0.50, 3.30), 'frequencies': ('6M', '6M')},
+    'CHF': {'deposits': [('3M', 'SFDR3 Curncy'), ('6M', 'SFDR6 Curncy')],
+            'swap': 'SFSW{years} Curncy', 'cusip': None, 'levels': (0.05, 1.70), 'frequencies': ('1Y', '6M')},
+}
+
+CURRENCY_WEIGHTS = {'USD': 0.45, 'EUR': 0.25, 'GBP': 0.12, 'CAD': 0.10, 'CHF': 0.08}
+TENOR_YEARS = np.array([1, 2, 3, 5, 7, 10, 15, 20, 30])
+TENOR_WEIGHTS = np.array([0.06, 0.14, 0.10, 0.22, 0.08, 0.25, 0.05, 0.04, 0.06])
+NOTIONALS = np.array([1e6, 5e6, 10e6, 25e6, 50e6, 100e6])
+
+
+def _rng(seed, currency=None):
+    stream = sorted(CURVE_INSTRUMENTS).index(currency) + 1 if currency else 0
+    return np.random.default_rng([seed, stream])
+
+
+def _par_rate(currency, years):
+    """
+    Smooth par rate in percent by tenor in years: a Nelson-Siegel shape between the short and
+    long levels of the currency.
+    """
+    short, long = CURVE_INSTRUMENTS[currency]['levels']
+    years = np.asarray(years, dtype=float)
+    decay = years / 2.5
+    return long + (short - long) * (1 - np.exp(-decay)) / decay
+
+
+def synthetic_curve(currency, evaluation_date, seed=0):
+    """
+    Build a curve quote sheet for a currency that bootstraps with its conventions.
+
+    Parameters:
+    currency (str): Currency code.
+    evaluation_date (str or pandas.Timestamp): The quote date, used for the 'Update' column.
+    seed (int): Seed of the quote noise; the same seed gives the same sheet.
+
+    Returns:
+    pandas.DataFrame: The quote sheet.
+    """
+    instruments = CURVE_INSTRUMENTS[currency]
+    rng = _rng(seed, currency)
+    update = f"{pd.Timestamp(evaluation_date):%m/%d/%Y}"
+    rows = []
+    for tenor, description in instruments['deposits']:
+        years = int(tenor[:-1]) / 12
+        rows.append((tenor, description, _par_rate(currency, years), '', None))
+    for years in SWAP_YEARS:
+        cusip = instruments['cusip'].format(years=years) if instruments['cusip'] else None
+        rows.append((f"{years}Y", instruments['swap'].format(years=years), _par_rate(currency, years), '', cusip))
+
+    yields = np.array([row[2] for row in rows]) + rng.normal(0, 0.01, len(rows))
+    return pd.DataFrame({'Tenor': [row[0] for row in rows],
+                         'Description': [row[1] for row in rows],
+                         'Yield': np.round(yields, 5),
+                         'Source': 'BGN',
+                         'Update': update,
+                         'CUSIP': [row[4] for row in rows]}, columns=CURVE_COLUMNS)
+
+
+def _format_dates(serials):
+    return pd.Series((np.asarray(serials, dtype=np.int64) - EPOCH_SERIAL).astype('datetime64[D]')).dt.strftime('%m/%d/%Y')
+
+
+def synthetic_trades(n, evaluation_date, currencies=None, seed=0):
+    """
+    Build an SDR transaction sheet of plain fixed/float swaps traded on the evaluation date.
+
+    Trades are spot-starting or forward-starting within a year, with standard tenors, fixed
+    rates near the synthetic par curve and the fixed leg on either side.
+
+    Parameters:
+    n (int): Number of trades.
+    evaluation_date (str or pandas.Timestamp): The trade date.
+    currencies (list): Currencies to draw from; all supported currencies by default.
+    seed (int): Random seed; the same seed gives the same sheet.
+
+    Returns:
+    pandas.DataFrame: The trades in TRANSACTION_COLUMNS layout.
+    """
+    rng = _rng(seed)
+    currencies = list(currencies or CURRENCY_WEIGHTS)
+    weights = np.array([CURRENCY_WEIGHTS.get(currency, 0.1) for currency in currencies])
+    currency = np.array(currencies)[rng.choice(len(currencies), n, p=weights / weights.sum())]
+
+    trade_date = pd.Timestamp(evaluation_date).normalize()
+    trade_serial = (trade_date - pd.Timestamp('1970-01-01')).days + EPOCH_SERIAL
+    forward = np.where(rng.random(n) < 0.85, 0, rng.choice([1, 3, 6, 12], n))
+    effective = add_months(np.full(n, trade_serial + 2), forward)
+    years = rng.choice(TENOR_YEARS, n, p=TENOR_WEIGHTS)
+    maturity = add_months(effective, 12 * years)
+
+    fixed_rate = np.round(np.maximum(_par_rate_by_currency(currency, years) + rng.normal(0, 0.08, n), 0.001), 3)
+    fixed_first = rng.random(n) < 0.8
+    frequencies = {code: CURVE_INSTRUMENTS[code]['frequencies'] for code in currencies}
+    fixed_frequency = np.array([frequencies[code][0] for code in currency])
+    float_frequency = np.array([frequencies[code][1] for code in currency])
+    seconds = rng.integers(8 * 3600, 17 * 3600, n)
+
+    return pd.DataFrame({
+        'Trade Time': (trade_date + pd.to_timedelta(np.sort(seconds), unit='s')).strftime('%Y-%m-%d %H:%M:%S'),
+        'Type': 'IRS Fix-Float',
+        'Clr': np.where(rng.random(n) < 0.7, 'C', 'U'),
+        'Curr': currency,
+        'Effective': _format_dates(effective),
+        'Maturity': _format_dates(maturity),
+        'Rate 1': np.where(fixed_first, fixed_rate, np.nan),
+        'Leg 1': np.where(fixed_first, 'FIXED', 'LIBOR'),
+        'Rate 2': np.where(fixed_first, np.nan, fixed_rate),
+        'Leg 2': np.where(fixed_first, 'LIBOR', 'FIXED'),
+        'Not.': rng.choice(NOTIONALS, n),
+        'PF 1': np.where(fixed_first, fixed_frequency, float_frequency),
+        'PF 2': np.where(fixed_first, float_frequency, fixed_frequency),
+    }, columns=TRANSACTION_COLUMNS)
+
+
+def _par_rate_by_currency(currency, years):
+    rates = np.empty(len(currency))
+    for code in np.unique(currency):
+        selected = currency == code
+        rates[selected] = _par_rate(code, years[selected])
+    return rates
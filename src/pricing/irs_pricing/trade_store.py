@@ -0,0 +1,112 @@
+# Name: trade_store.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Persistent store of priced trades for incremental re-pricing. A trade is keyed
+# by a hash of its economics (dates, rates, legs, notional, frequencies, currency) and stored
+# per curve key (currency, evaluation date, quotes hash), so a run only prices the rows that
+# are new or changed since a previous run against the same curve.
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .dates import parse_date_columns
+from .validation import NUMERIC_COLUMNS
+
+ECONOMICS_COLUMNS = ['Curr', 'Effective', 'Maturity', 'Leg 1', 'Rate 1', 'PF 1', 'Leg 2', 'Rate 2', 'PF 2', 'Not.']
+
+
+def trade_hashes(transaction_df, dates=None):
+    """
+    Hash the economics of every trade.
+
+    Dates are hashed as serial numbers and rates and notionals as floats, so the same trade
+    read from Excel, CSV or Parquet gets the same hash.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades.
+    dates (dict): Optional output of parse_date_columns for the same rows.
+
+    Returns:
+    numpy.ndarray: uint64 hashes aligned to the input rows.
+    """
+    if dates is None:
+        dates = parse_date_columns(transaction_df)
+    economics = {}
+    for column in ECONOMICS_COLUMNS:
+        if column in dates:
+            economics[column] = dates[column]
+        elif column in NUMERIC_COLUMNS:
+            economics[column] = pd.to_numeric(transaction_df[column], errors='coerce').astype(float).to_numpy()
+        else:
+            economics[column] = transaction_df[column].astype('string').str.strip().to_numpy()
+    return pd.util.hash_pandas_object(pd.DataFrame(economics), index=False).to_numpy()
+
+
+class TradeStore:
+    """
+    Directory of priced trades saved as one .npz file per curve key.
+
+    Trades that could not be priced are stored as NaN so they are not retried against the
+    same curve.
+
+    Parameters:
+    directory (str): Store directory; created if missing.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, currency, evaluation_date, quotes_key):
+        return os.path.join(self.directory,
+                            f"{currency}_{evaluation_date.ISO()}_{quotes_key}.npz")
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return np.empty(0, dtype=np.uint64), np.empty(0), np.empty(0)
+        with np.load(path) as stored:
+            return stored['hashes'], stored['fair_rate'], stored['difference']
+
+    def lookup(self, currency, evaluation_date, quotes_key, hashes):
+        """
+        Look up stored prices for a set of trade hashes.
+
+        Returns:
+        tuple: (found mask, fair rates, differences) aligned to `hashes`; NaN where not found.
+        """
+        stored_hashes, stored_fair, stored_difference = self._read(self.path(currency, evaluation_date, quotes_key))
+        fair_rate = np.full(len(hashes), np.nan)
+        difference = np.full(len(hashes), np.nan)
+        positions = np.searchsorted(stored_hashes, hashes)
+        positions[positions == len(stored_hashes)] = 0
+        found = (stored_hashes[positions] == hashes) if len(stored_hashes) else np.zeros(len(hashes), dtype=bool)
+        fair_rate[found] = stored_fair[positions[found]]
+        difference[found] = stored_difference[positions[found]]
+        self.hits += int(found.sum())
+        self.misses += int((~found).sum())
+        return found, fair_rate, difference
+
+    def save(self, currency, evaluation_date, quotes_key, hashes, fair_rate, difference):
+        """
+        Merge newly priced trades into the stored set. The file is written atomically so
+        concurrent batch workers never see a partial store.
+        """
+        path = self.path(currency, evaluation_date, quotes_key)
+        stored_hashes, stored_fair, stored_difference = self._read(path)
+        hashes = np.concatenate([hashes, stored_hashes])
+        fair_rate = np.concatenate([fair_rate, stored_fair])
+        difference = np.concatenate([difference, stored_difference])
+        # np.unique keeps the first occurrence, so new prices replace stored ones
+        hashes, first = np.unique(hashes, return_index=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.npz')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, hashes=hashes, fair_rate=fair_rate[first], difference=difference[first])
+        os.replace(tmp_path, path)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
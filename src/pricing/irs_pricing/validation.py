@@ -0,0 +1,97 @@
+# Name: validation.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Vectorized pre-screen of SDR trades that cannot be priced. Rejected rows get a
+# reason code and are dropped before the QuantLib loop instead of failing inside it.
+
+import numpy as np
+import pandas as pd
+
+from .dates import parse_date_columns
+
+# Reason codes, in the order they are checked; a row gets the first code that applies
+BAD_DATES = 'BAD_DATES'
+MATURITY_NOT_AFTER_EFFECTIVE = 'MATURITY_NOT_AFTER_EFFECTIVE'
+ONE_TIME_PAYMENT = 'ONE_TIME_PAYMENT'
+BAD_FREQUENCY = 'BAD_FREQUENCY'
+MISSING_FIXED_RATE = 'MISSING_FIXED_RATE'
+BAD_NOTIONAL = 'BAD_NOTIONAL'
+
+REJECT_COLUMNS = ['Curr', 'Effective', 'Maturity', 'Leg 1', 'Rate 1', 'PF 1', 'Leg 2', 'Rate 2', 'PF 2', 'Not.']
+
+# Parsed as numbers, with missing values (JSON nulls included) as NaN
+NUMERIC_COLUMNS = ['Rate 1', 'Rate 2', 'Not.']
+
+# Read and written as text, so every chunk of a file gets the same column types
+TEXT_COLUMNS = ['Curr', 'Effective', 'Maturity', 'Leg 1', 'PF 1', 'Leg 2', 'PF 2']
+
+_PERIOD_PATTERN = r'^\d+[DWMY]$'
+
+
+def reject_reasons(transaction_df, dates=None):
+    """
+    Assign a reason code to every trade that cannot be priced.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades.
+    dates (dict): Optional output of parse_date_columns for the same rows.
+
+    Returns:
+    pandas.Series: Reason codes aligned to the input rows; None where the trade is priceable.
+    """
+    if dates is None:
+        dates = parse_date_columns(transaction_df)
+    effective, maturity = dates['Effective'], dates['Maturity']
+
+    pf_1 = transaction_df['PF 1'].astype('string')
+    pf_2 = transaction_df['PF 2'].astype('string')
+    fixed_first = (transaction_df['Leg 1'] == 'FIXED').to_numpy()
+    rate_1 = pd.to_numeric(transaction_df['Rate 1'], errors='coerce').to_numpy()
+    rate_2 = pd.to_numeric(transaction_df['Rate 2'], errors='coerce').to_numpy()
+    fixed_rate = np.where(fixed_first, rate_1, rate_2)
+    notional = pd.to_numeric(transaction_df['Not.'], errors='coerce').to_numpy()
+
+    conditions = [
+        np.isnan(effective) | np.isnan(maturity),
+        maturity <= effective,
+        ((pf_1 == '1T') | (pf_2 == '1T')).fillna(False).to_numpy(),
+        ~(pf_1.str.match(_PERIOD_PATTERN) & pf_2.str.match(_PERIOD_PATTERN)).fillna(False).to_numpy(),
+        np.isnan(fixed_rate),
+        np.isnan(notional),
+    ]
+    codes = [BAD_DATES, MATURITY_NOT_AFTER_EFFECTIVE, ONE_TIME_PAYMENT, BAD_FREQUENCY, MISSING_FIXED_RATE,
+             BAD_NOTIONAL]
+    reasons = np.select(conditions, codes, default='')
+    return pd.Series(np.where(reasons == '', None, reasons), index=transaction_df.index, name='Reason')
+
+
+def screen_trades(transaction_df):
+    """
+    Split trades into priceable rows and rejects.
+
+    Parameters:
+    transaction_df (pandas.DataFrame): SDR trades.
+
+    Returns:
+    tuple: (accepted trades, rejects) where rejects holds REJECT_COLUMNS plus 'Reason',
+    indexed by the original row labels.
+    """
+    reasons = reject_reasons(transaction_df)
+    rejected = reasons.notna().to_numpy()
+    columns = [c for c in REJECT_COLUMNS if c in transaction_df.columns]
+    rejects = transaction_df.loc[rejected, columns].assign(Reason=reasons[rejected])
+    return transaction_df.loc[~rejected], rejects
+
+
+def summarize_rejects(rejects):
+    """
+    Count rejects per reason code, e.g. for a one-line log message.
+    """
+    return rejects['Reason'].value_counts().to_dict()
+
+
+def write_rejects(rejects, path):
+    """
+    Write rejects as CSV with the original row label in a 'Row' column.
+    """
+    rejects.rename_axis('Row').to_csv(path)
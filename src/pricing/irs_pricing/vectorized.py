@@ -0,0 +1,427 @@
+# Name: vectorized.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: NumPy fair-rate pricer for plain fixed/float swaps. Instead of building a
+# ql.VanillaSwap per trade, the fair rate is computed as float-leg PV over fixed-leg annuity
+# using the bootstrapped curve nodes, padded schedule arrays and vectorized year fractions.
+# Legs are valued once per unique schedule and gathered back onto the trades.
+
+import hashlib
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+import QuantLib as ql
+
+from .calendars import get_business_day_table
+from .dates import parse_date_columns, serials_to_ymd
+from .forwards import get_forward_cache
+from .metrics import get_run_metrics
+from .pricer import SwapPricer, attach_prices
+from .schedules import ScheduleCache
+
+# QuantLib's Null<Real>, returned by pastFixing when no fixing is stored
+NULL_RATE = np.finfo(np.float32).max
+
+
+class CurveNodes:
+    """
+    Log-discount nodes of a bootstrapped curve, interpolated log-linearly in time.
+
+    This reproduces ql.PiecewiseFlatForward (flat instantaneous forwards between nodes,
+    extrapolated flat beyond the last node) and any log-linear discount curve.
+
+    Parameters:
+    reference_serial (int): Serial number of the curve reference date.
+    times (numpy.ndarray): Node times in years (Actual/365 Fixed) from the reference date.
+    log_discounts (numpy.ndarray): Log discount factors at the node times.
+    """
+
+    def __init__(self, reference_serial, times, log_discounts):
+        self.reference_serial = reference_serial
+        self.times = np.asarray(times, dtype=float)
+        self.log_discounts = np.asarray(log_discounts, dtype=float)
+        self._key = None
+
+    @classmethod
+    def from_curve(cls, yield_curve):
+        dates = yield_curve.dates()
+        reference = yield_curve.referenceDate()
+        times = np.array([(d.serialNumber() - reference.serialNumber()) / 365.0 for d in dates])
+        log_discounts = np.log([yield_curve.discount(d) for d in dates])
+        return cls(reference.serialNumber(), times, log_discounts)
+
+    def discount(self, serials):
+        """
+        Discount factors for an array of ql.Date serial numbers (NaN entries stay NaN).
+        """
+        t = (np.asarray(serials, dtype=float) - self.reference_serial) / 365.0
+        log_df = np.interp(t, self.times, self.log_discounts)
+        if len(self.times) > 1:
+            last_slope = ((self.log_discounts[-1] - self.log_discounts[-2]) /
+                          (self.times[-1] - self.times[-2]))
+            beyond = t > self.times[-1]
+            log_df = np.where(beyond, self.log_discounts[-1] + last_slope * (t - self.times[-1]), log_df)
+        return np.exp(log_df)
+
+    @property
+    def key(self):
+        """
+        Short hash of the reference date and nodes, identifying the curve in caches.
+        """
+        if self._key is None:
+            digest = hashlib.sha256(np.int64(self.reference_serial).tobytes())
+            digest.update(self.times.tobytes())
+            digest.update(self.log_discounts.tobytes())
+            self._key = digest.hexdigest()[:16]
+        return self._key
+
+    def shifted(self, zero_shift_bps):
+        """
+        Nodes with the continuously compounded zero rates moved by `zero_shift_bps` at each node.
+        """
+        return CurveNodes(self.reference_serial, self.times,
+                          self.log_discounts - np.asarray(zero_shift_bps, dtype=float) / 10000 * self.times)
+
+
+def year_fractions(start_serials, end_serials, day_counter):
+    """
+    Vectorized year fractions between two arrays of ql.Date serial numbers.
+
+    Actual/360, Actual/365 (Fixed), 30/360 Bond Basis and 30E/360 are computed with array
+    arithmetic; other day counters fall back to QuantLib once per unique date pair.
+    Zero-length pairs (schedule padding) have a zero year fraction.
+    """
+    start_serials = np.asarray(start_serials, dtype=np.int64)
+    end_serials = np.asarray(end_serials, dtype=np.int64)
+    name = day_counter.name()
+
+    if name == 'Actual/360':
+        return (end_serials - start_serials) / 360.0
+    if name == 'Actual/365 (Fixed)':
+        return (end_serials - start_serials) / 365.0
+    if name in ('30/360 (Bond Basis)', '30E/360 (Eurobond Basis)'):
+        y1, m1, d1 = serials_to_ymd(start_serials)
+        y2, m2, d2 = serials_to_ymd(end_serials)
+        d1 = np.minimum(d1, 30)
+        if name == '30/360 (Bond Basis)':
+            d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+        else:
+            d2 = np.minimum(d2, 30)
+        return (360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)) / 360.0
+
+    pairs, inverse = np.unique(np.stack([start_serials, end_serials], axis=-1).reshape(-1, 2),
+                               axis=0, return_inverse=True)
+    fractions = np.zeros(len(pairs))
+    for k, (s, e) in enumerate(pairs):
+        if e > s:
+            start, end = ql.Date(int(s)), ql.Date(int(e))
+            # The accrual period doubles as the reference period, as in a regular coupon
+            fractions[k] = day_counter.yearFraction(start, end, start, end)
+    return fractions[inverse.ravel()].reshape(start_serials.shape)
+
+
+def _padded(schedules):
+    """
+    Stack a list of date serial lists into a (n, max_len) array padded with NaN.
+    """
+    width = max(len(s) for s in schedules)
+    padded = np.full((len(schedules), width), np.nan)
+    for i, s in enumerate(schedules):
+        padded[i, :len(s)] = s
+    return padded
+
+
+class SwapArrays:
+    """
+    Curve-independent arrays of a batch of trades, built by VectorizedPricer.prepare.
+
+    Trades that cannot be priced are excluded by the `ok` mask; every other array covers
+    the `ok` trades only, or the unique schedules gathered through the code arrays.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.ok = np.zeros(n, dtype=bool)
+        self.fixed_rate = self.spread = None
+        self.fixed_codes = self.float_codes = None
+        self.fixed_end = self.fixed_weight = None
+        self.float_leg = None
+
+
+class VectorizedPricer:
+    """
+    Prices plain fixed/float swaps with array math against one curve.
+
+    Parameters:
+    yield_curve (ql.YieldTermStructure): The bootstrapped forwarding and discounting curve.
+    index (ql.IborIndex): The floating index of the currency (supplies fixings and conventions).
+    convention (CurrencyConvention): The currency conventions.
+    schedule_cache (ScheduleCache): Shared schedule cache; a private one is created if omitted.
+    forward_cache (ForwardCache): Forward memo; the process-wide one is used if omitted.
+    nodes (CurveNodes): The curve's nodes, e.g. views of a SharedCurves array; read from the
+        curve if omitted.
+    """
+
+    def __init__(self, yield_curve, index, convention, schedule_cache=None, forward_cache=None, nodes=None):
+        self.yield_curve = yield_curve
+        self.index = index
+        self.convention = convention
+        self.schedule_cache = schedule_cache if schedule_cache is not None else ScheduleCache()
+        self.forward_cache = forward_cache if forward_cache is not None else get_forward_cache()
+        self.nodes = nodes if nodes is not None else CurveNodes.from_curve(yield_curve)
+        self._fixings = {}
+
+    def _schedule_arrays(self, effective, maturity, tenors):
+        """
+        Build each unique (effective, maturity, tenor) schedule once.
+
+        Month and year tenors are generated together per tenor from the calendar's business-day
+        table; other tenors, and dates outside the table, go through the schedule cache.
+
+        Returns:
+        tuple: (padded date serials of the unique schedules, index of each trade's schedule)
+        """
+        keys = pd.DataFrame({'effective': effective, 'maturity': maturity, 'tenor': tenors})
+        codes, uniques = pd.MultiIndex.from_frame(keys).factorize()
+        convention = self.convention
+        table = get_business_day_table(convention.calendar)
+        unique_effective = uniques.get_level_values(0).to_numpy(dtype=np.int64)
+        unique_maturity = uniques.get_level_values(1).to_numpy(dtype=np.int64)
+        unique_tenor = uniques.get_level_values(2).to_numpy()
+        schedules = [None] * len(uniques)
+        for tenor in pd.unique(unique_tenor):
+            rows = np.flatnonzero(unique_tenor == tenor)
+            period = ql.Period(tenor)
+            months = {ql.Months: 1, ql.Years: 12}.get(period.units(), 0) * period.length()
+            if months > 0 and table.covers(unique_effective[rows]) and table.covers(unique_maturity[rows]):
+                dates = table.schedules(unique_effective[rows], unique_maturity[rows], months,
+                                        ql.ModifiedFollowing, convention.schedule_rule, convention.end_of_month)
+                for row, schedule in zip(rows, dates):
+                    schedules[row] = schedule[~np.isnan(schedule)]
+                continue
+            for row in rows:
+                schedule = self.schedule_cache.get(ql.Date(int(unique_effective[row])),
+                                                   ql.Date(int(unique_maturity[row])),
+                                                   period,
+                                                   convention.calendar,
+                                                   ql.ModifiedFollowing,
+                                                   convention.schedule_rule,
+                                                   convention.end_of_month)
+                schedules[row] = [d.serialNumber() for d in schedule.dates()]
+        return _padded(schedules), codes
+
+    def _fixing(self, fixing_serial):
+        """
+        The stored historical fixing of a date, or NaN if there is none.
+        """
+        if fixing_serial not in self._fixings:
+            try:
+                fixing = self.index.pastFixing(ql.Date(int(fixing_serial)))
+            except RuntimeError:
+                fixing = None
+            self._fixings[fixing_serial] = np.nan if fixing is None or fixing == NULL_RATE else fixing
+        return self._fixings[fixing_serial]
+
+    def _fixed_leg(self, dates):
+        """
+        Discount dates and discount-factor weights (accrual fractions of the live coupons) of
+        each fixed-leg schedule; the fixed-leg annuity is their dot product with the discounts.
+        """
+        start, end = dates[:, :-1], dates[:, 1:]
+        valid = ~np.isnan(end)
+        start, end = np.where(valid, start, dates[:, :1]), np.where(valid, end, dates[:, :1])
+        tau = year_fractions(start, end, self.convention.fixed_day_counter)
+        live = valid & (end > self.nodes.reference_serial)
+        return end, np.where(live, tau, 0.0)
+
+    def _fixing_dates(self, serials):
+        """
+        Map accrual dates to the index fixing date and fixing value date.
+        """
+        table = get_business_day_table(self.index.fixingCalendar())
+        fixing_days = self.index.fixingDays()
+        fixing = table.advance_days(serials, -fixing_days)
+        value = table.advance_days(fixing, fixing_days)
+        return fixing.astype(float), value.astype(float)
+
+    def _float_leg(self, dates):
+        """
+        Curve-independent arrays of each float-leg schedule.
+
+        Forecast coupons follow QuantLib's par-coupon estimation period (fixing value date of the
+        accrual start to that of the accrual end); coupons fixed before the evaluation date use
+        the index's historical fixings, and so do coupons fixing on it if that day's fixing is
+        stored.
+        """
+        reference_serial = self.nodes.reference_serial
+        day_counter = self.index.dayCounter()
+        start, end = dates[:, :-1], dates[:, 1:]
+        valid = ~np.isnan(end)
+        start, end = np.where(valid, start, dates[:, :1]), np.where(valid, end, dates[:, :1])
+        live = valid & (end > reference_serial)
+        tau = year_fractions(start, end, day_counter)
+
+        fixing_date, value_start = self._fixing_dates(start)
+        _, value_end = self._fixing_dates(end)
+        value_end = np.maximum(value_end, value_start + 1)
+
+        fixed = live & (fixing_date <= reference_serial)
+        fixings = np.full(fixed.shape, np.nan)
+        for i, j in zip(*np.nonzero(fixed)):
+            fixings[i, j] = self._fixing(fixing_date[i, j])
+        # Without a stored fixing, a coupon fixing today is forecast like any later one
+        fixed &= ~(np.isnan(fixings) & (fixing_date == reference_serial))
+
+        # Coupons still to be projected, reduced to their unique estimation periods
+        projected = live & ~fixed
+        periods = np.stack([fixing_date[projected], value_start[projected], value_end[projected]], axis=-1)
+        periods, inverse, counts = np.unique(periods, axis=0, return_inverse=True, return_counts=True)
+        period_codes = np.zeros(fixed.shape, dtype=np.int64)
+        period_codes[projected] = inverse.ravel()
+        return {'end': end, 'tau': tau, 'live': live, 'fixed': fixed, 'fixings': fixings,
+                'periods': periods, 'period_codes': period_codes, 'period_counts': counts}
+
+    def prepare(self, transaction_df):
+        """
+        Build the curve-independent arrays of a batch: trade terms, schedules, year fractions,
+        fixing dates and historical fixings. The result can be valued against any CurveNodes
+        with the same reference date.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades of the pricer's currency.
+
+        Returns:
+        SwapArrays: The prepared batch.
+        """
+        n = len(transaction_df)
+        arrays = SwapArrays(n)
+        if n == 0:
+            return arrays
+
+        dates = parse_date_columns(transaction_df)
+        effective, maturity = dates['Effective'], dates['Maturity']
+        fixed_first = (transaction_df['Leg 1'] == 'FIXED').to_numpy()
+        pf_1, pf_2 = transaction_df['PF 1'].to_numpy(), transaction_df['PF 2'].to_numpy()
+        rate_1 = pd.to_numeric(transaction_df['Rate 1'], errors='coerce').to_numpy()
+        rate_2 = pd.to_numeric(transaction_df['Rate 2'], errors='coerce').to_numpy()
+
+        fixed_tenor = np.where(fixed_first, pf_1, pf_2)
+        float_tenor = np.where(fixed_first, pf_2, pf_1)
+        fixed_rate = np.where(fixed_first, rate_1, rate_2)
+        fixed_rate = np.where(fixed_rate > 10, fixed_rate / 100, fixed_rate)
+        spread = np.where(fixed_first, rate_2, rate_1)
+        spread = np.where(spread > 10, spread / 100, spread)
+        spread = np.nan_to_num(spread)
+
+        ok = (~np.isnan(effective) & ~np.isnan(maturity) & (maturity > effective) &
+              (pf_1 != '1T') & (pf_2 != '1T') &
+              pd.notna(fixed_tenor) & pd.notna(float_tenor))
+        arrays.ok = ok
+        if not ok.any():
+            return arrays
+
+        fixed_dates, arrays.fixed_codes = self._schedule_arrays(effective[ok], maturity[ok], fixed_tenor[ok])
+        float_dates, arrays.float_codes = self._schedule_arrays(effective[ok], maturity[ok], float_tenor[ok])
+        arrays.fixed_end, arrays.fixed_weight = self._fixed_leg(fixed_dates)
+        arrays.float_leg = self._float_leg(float_dates)
+        arrays.fixed_rate = fixed_rate[ok]
+        arrays.spread = spread[ok]
+        return arrays
+
+    def value(self, arrays, nodes=None):
+        """
+        Value a prepared batch against curve nodes (the pricer's own curve by default).
+
+        Returns:
+        tuple: (fair rates in percent, differences in bps) aligned to the prepared rows.
+        """
+        nodes = nodes if nodes is not None else self.nodes
+        fair_rate, difference = np.full(arrays.n, np.nan), np.full(arrays.n, np.nan)
+        if not arrays.ok.any():
+            return fair_rate, difference
+
+        annuity = (arrays.fixed_weight * nodes.discount(arrays.fixed_end)).sum(axis=1)[arrays.fixed_codes]
+
+        leg = arrays.float_leg
+        discount_end = nodes.discount(leg['end'])
+        periods = leg['periods']
+        day_counter = self.index.dayCounter()
+
+        def project(value_start, value_end):
+            span = year_fractions(value_start, value_end, day_counter)
+            return (nodes.discount(value_start) / nodes.discount(value_end) - 1.0) / span
+
+        forwards = self.forward_cache.forwards(self.index.name(), nodes.key, periods[:, 0], periods[:, 1],
+                                               periods[:, 2], project, leg['period_counts'])
+        rate = np.where(leg['fixed'], leg['fixings'], forwards[leg['period_codes']] if len(forwards) else 0.0)
+        float_pv = np.where(leg['live'], leg['tau'] * rate * discount_end, 0.0).sum(axis=1)
+        float_annuity = np.where(leg['live'], leg['tau'] * discount_end, 0.0).sum(axis=1)
+        float_pv = float_pv[arrays.float_codes] + arrays.spread / 100 * float_annuity[arrays.float_codes]
+
+        ok = arrays.ok
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fair_rate[ok] = np.where(annuity > 0, float_pv / annuity, np.nan) * 100
+        difference[ok] = (arrays.fixed_rate - fair_rate[ok]) * 100
+        return fair_rate, difference
+
+    def price_arrays(self, transaction_df):
+        """
+        Price every trade in a DataFrame at once.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades of the pricer's currency.
+
+        Returns:
+        tuple: (fair rates in percent, differences in bps) as arrays aligned to the input rows;
+        trades that cannot be priced are NaN. The run metrics record every trade with the
+        batch's mean latency and count the NaN trades as failed.
+        """
+        metrics = get_run_metrics()
+        start = time.perf_counter()
+        with metrics.stage('pricing'):
+            fair_rate, difference = self.value(self.prepare(transaction_df))
+        if len(transaction_df):
+            metrics.observe_latency((time.perf_counter() - start) / len(transaction_df), len(transaction_df))
+        metrics.count('failed', np.isnan(fair_rate).sum())
+        return fair_rate, difference
+
+    def price(self, transaction_df):
+        """
+        Price a batch of trades; same output layout as SwapPricer.price.
+        """
+        return attach_prices(transaction_df, *self.price_arrays(transaction_df))
+
+    def cross_check(self, transaction_df, sample_size=100, seed=0):
+        """
+        Price a random sample through QuantLib and compare with the vectorized results.
+
+        Parameters:
+        transaction_df (pandas.DataFrame): SDR trades of the pricer's currency.
+        sample_size (int): Number of trades to re-price through ql.VanillaSwap.
+        seed (int): Seed of the sampling.
+
+        Returns:
+        dict: Sample size, number compared and the maximum absolute 'Difference' deviation in bps.
+        """
+        sample = transaction_df.sample(n=min(sample_size, len(transaction_df)), random_state=seed)
+        fair_rate, _ = self.value(self.prepare(sample))
+        reference = SwapPricer(self.yield_curve, self.index, self.convention, self.schedule_cache)
+
+        deviations = []
+        for position, (_, row) in enumerate(sample.iterrows()):
+            try:
+                priced = reference.price_trade(row)
+            except Exception:
+                priced = None
+            if priced is None or np.isnan(fair_rate[position]):
+                continue
+            deviations.append(abs(priced[0] - fair_rate[position]) * 100)
+
+        max_deviation = max(deviations) if deviations else np.nan
+        logging.info(f"Vectorized cross-check: {len(deviations)} trades compared, "
+                     f"max deviation {max_deviation:.6f} bps")
+        return {'sample_size': len(sample),
+                'compared': len(deviations),
+                'max_deviation_bps': max_deviation}
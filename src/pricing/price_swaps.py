@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+# Name: price_swaps.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script prices interest rate swaps using QuantLib for any mix of
+# USD, CAD, EUR, GBP and CHF trades. It replaces the per-currency price_swaps_<ccy>.py scripts.
+#
+# Example:
+#   ./src/pricing/price_swaps.py trades.xlsx priced.xlsx 2013-03-11 \
+#       --curve USD=data/raw/curves/USD/usd_03112013.xlsx --curve CAD=data/raw/curves/CAD/cad_03112013.xlsx
+
+from irs_pricing.cli import main
+
+if __name__ == "__main__":
+    main()
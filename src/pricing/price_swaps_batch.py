@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+# Name: price_swaps_batch.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script prices interest rate swaps for a range or list of evaluation dates,
+# one date per worker process, and writes a single consolidated output file.
+#
+# Example:
+#   ./src/pricing/price_swaps_batch.py data/results/USD_all_priced.xlsx \
+#       --transactions "data/processed/USD/{date:%Y-%m-%d}_output.xlsx" \
+#       --curve "USD=data/raw/curves/USD/usd_{date:%m%d%Y}.xlsx" \
+#       --dates_file data/sampled_days.txt --processes 8
+
+from irs_pricing.batch import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+
+# Name: pricing_service.py
+# Last Updated: 2026-10-18
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: This script runs a resident pricing service that keeps bootstrapped curves and
+# fixings in memory per currency and date, and prices batches of trades sent over localhost
+# HTTP or a Unix socket. From a notebook:
+#   from irs_pricing.service import PricingClient
+#   priced = PricingClient('127.0.0.1:8765').price(trades_df)
+#
+# Example:
+#   ./src/pricing/pricing_service.py --curve 'USD=data/raw/curves/USD/usd_{date:%m%d%Y}.xlsx' \
+#       --curve 'CAD=data/raw/curves/CAD/cad_{date:%m%d%Y}.xlsx' --preload 2013-03-11
+
+from irs_pricing.service import main
+
+if __name__ == "__main__":
+    main()
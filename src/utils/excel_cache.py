@@ -0,0 +1,152 @@
+# Name: excel_cache.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Fast Excel ingestion. Workbooks are parsed with the calamine engine when
+# python-calamine is installed (openpyxl otherwise) and each parsed sheet is kept as an
+# uncompressed Feather sidecar stamped with the workbook's path, size and modification time.
+# Later reads of an unchanged workbook load the sidecar memory-mapped instead of re-parsing.
+# Only pandas is required. The analysis scripts append src/utils to sys.path to import it;
+# irs_pricing re-exports it as irs_pricing.excel.
+
+import argparse
+import hashlib
+import logging
+import os
+import tempfile
+
+import pandas as pd
+
+try:
+    import python_calamine  # noqa: F401
+    ENGINE = 'calamine'
+except ImportError:
+    ENGINE = None
+
+# Directory for sidecars when workbooks sit in read-only directories; next to each workbook if unset
+SIDECAR_DIR_VARIABLE = 'EXCEL_SIDECAR_DIR'
+
+# (sidecar, stamp) of sheets that could not be converted, so they are not retried on every read
+_uncacheable = set()
+
+
+def sidecar_path(path, sheet_name=0):
+    """
+    Path of the Feather sidecar of one sheet of a workbook.
+
+    Sidecars are written next to the workbook as <workbook>.<sheet>.feather, or, if the
+    EXCEL_SIDECAR_DIR environment variable is set, into that directory under a hash of the
+    workbook's absolute path.
+    """
+    directory = os.environ.get(SIDECAR_DIR_VARIABLE)
+    if directory:
+        digest = hashlib.sha1(f"{os.path.abspath(path)}|{sheet_name}".encode()).hexdigest()[:20]
+        return os.path.join(directory, f"{digest}.feather")
+    return f"{path}.{sheet_name}.feather"
+
+
+def _stamp(path):
+    stat = os.stat(path)
+    return {'source_path': os.path.abspath(path), 'source_size': str(stat.st_size),
+            'source_mtime_ns': str(stat.st_mtime_ns)}
+
+
+def _load_sidecar(sidecar, stamp):
+    """
+    Returns:
+    pandas.DataFrame: The sidecar's sheet if it was written from the workbook as it is now, else None.
+    """
+    import pyarrow as pa
+
+    if not os.path.exists(sidecar):
+        return None
+    try:
+        with pa.memory_map(sidecar) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid) as e:
+        logging.warning(f"Ignoring unreadable Excel sidecar {sidecar}: {e}")
+        return None
+    metadata = {key.decode(): value.decode() for key, value in (table.schema.metadata or {}).items()}
+    if any(metadata.get(key) != value for key, value in stamp.items()):
+        return None
+    return table.to_pandas()
+
+
+def _write_sidecar(sidecar, df, stamp):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Columns mixing e.g. date cells and text cannot be stored without changing their values
+        logging.warning(f"Not caching {stamp['source_path']}: {e}")
+        _uncacheable.add((sidecar, tuple(stamp.values())))
+        return
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **stamp})
+    directory = os.path.dirname(sidecar) or '.'
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.feather')
+        with os.fdopen(fd, 'wb') as f:
+            feather.write_feather(table, f, compression='uncompressed')
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logging.warning(f"Could not write Excel sidecar {sidecar}: {e}")
+
+
+def read_excel(path, sheet_name=0, cache=True, **kwargs):
+    """
+    Read one sheet of a workbook, through its Feather sidecar when the workbook is unchanged.
+
+    A drop-in replacement for pd.read_excel(path) on a single sheet. The sidecar is skipped,
+    and the workbook parsed every time, when extra pd.read_excel arguments are given, when
+    pyarrow is not installed, or when a column mixes value types that Arrow cannot hold.
+
+    Parameters:
+    path (str): The workbook.
+    sheet_name (str or int): The sheet to read.
+    cache (bool): Read and write the sidecar.
+    **kwargs: Further pd.read_excel arguments.
+
+    Returns:
+    pandas.DataFrame: The sheet.
+    """
+    cache = cache and not kwargs and isinstance(path, (str, os.PathLike))
+    if cache:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            cache = False
+    if cache:
+        stamp = _stamp(path)
+        sidecar = sidecar_path(path, sheet_name)
+        cache = (sidecar, tuple(stamp.values())) not in _uncacheable
+    if cache:
+        df = _load_sidecar(sidecar, stamp)
+        if df is not None:
+            return df
+
+    df = pd.read_excel(path, sheet_name=sheet_name, engine=ENGINE, **kwargs)
+    if cache:
+        _write_sidecar(sidecar, df, stamp)
+    return df
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='Convert workbooks to Feather sidecars ahead of use')
+    parser.add_argument('workbooks', nargs='+', help='Excel files to convert')
+    parser.add_argument('--sheet', default=0, help='Sheet name or position')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    sheet_name = int(args.sheet) if str(args.sheet).isdigit() else args.sheet
+    for path in args.workbooks:
+        df = read_excel(path, sheet_name)
+        sidecar = sidecar_path(path, sheet_name)
+        print(f"{path}: {len(df)} rows -> {sidecar if os.path.exists(sidecar) else 'not cached'}")
+
+
+if __name__ == "__main__":
+    main()
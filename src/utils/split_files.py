@@ -4,6 +4,8 @@ import pandas as pd
 import os
 import argparse
 
+from excel_cache import read_excel
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Split Excel file based on date in the Trade Time column')
     parser.add_argument('input_file', help='Input Excel file')
@@ -16,7 +18,7 @@ def main():
     args = parse_arguments()
 
     # Read the Excel file
-    df = pd.read_excel(args.input_file)
+    df = read_excel(args.input_file)
 
     # Filter rows based on the conditions: Type is 'IRS Fix-Float'
     filtered_df = df[df['Type'] == 'IRS Fix-Float']
@@ -0,0 +1,61 @@
+# Name: conftest.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Shared fixtures for the irs_pricing tests. Inputs come from the synthetic module,
+# so the tests run without the Bloomberg and SDR workbooks.
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import QuantLib as ql
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src', 'pricing'))
+
+from irs_pricing import CONVENTIONS, reset_run_metrics, synthetic_curve  # noqa: E402
+
+EVALUATION_DATE = '2013-03-11'
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Level in percent of the flat synthetic fixings history of each currency's floating index
+FIXING_LEVELS = {'USD': 0.30, 'CAD': 1.20, 'EUR': 0.20, 'GBP': 0.50, 'CHF': 0.02}
+
+
+def write_fixings(directory, end=EVALUATION_DATE, start='2012-01-01'):
+    """
+    Write a fixings workbook for every convention that loads fixings, one row per valid fixing date.
+
+    Parameters:
+    directory (str): Directory to write the workbooks into.
+    end (str): Last fixing date.
+    start (str): First fixing date.
+    """
+    for currency, convention in CONVENTIONS.items():
+        if convention.fixings_file is None:
+            continue
+        index = convention.index(ql.YieldTermStructureHandle())
+        dates = pd.DatetimeIndex([date for date in pd.bdate_range(start, end)
+                                  if index.isValidFixingDate(ql.Date(date.day, date.month, date.year))])
+        level = FIXING_LEVELS[currency] + 0.01 * np.sin(np.arange(len(dates)) / 20)
+        pd.DataFrame({'Date': dates, 'PX_ASK': level.round(5), 'PX_LAST': level.round(5)}).to_excel(
+            os.path.join(directory, convention.fixings_file), index=False)
+
+
+@pytest.fixture(scope='session')
+def fixings_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('fixings')
+    write_fixings(str(directory))
+    return str(directory)
+
+
+@pytest.fixture(scope='session')
+def yield_curves():
+    return {currency: synthetic_curve(currency, EVALUATION_DATE) for currency in CONVENTIONS}
+
+
+@pytest.fixture(autouse=True)
+def run_metrics():
+    return reset_run_metrics()
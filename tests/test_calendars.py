@@ -0,0 +1,40 @@
+# Name: test_calendars.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: The table-driven schedule generator against ql.Schedule.
+
+import numpy as np
+import pytest
+import QuantLib as ql
+
+from conftest import EVALUATION_DATE
+from irs_pricing import CONVENTIONS, get_business_day_table, parse_date_column, synthetic_trades
+
+
+def ql_schedule(effective, maturity, months, convention, calendar):
+    schedule = ql.Schedule(ql.Date(int(effective)), ql.Date(int(maturity)), ql.Period(months, ql.Months), calendar,
+                           ql.ModifiedFollowing, ql.ModifiedFollowing, convention.schedule_rule,
+                           convention.end_of_month)
+    return [date.serialNumber() for date in schedule]
+
+
+@pytest.mark.parametrize('currency', sorted(CONVENTIONS))
+@pytest.mark.parametrize('months', [3, 6, 12])
+def test_schedules_match_ql_schedule(currency, months):
+    convention = CONVENTIONS[currency]
+    trades = synthetic_trades(200, EVALUATION_DATE, currencies=[currency], seed=11)
+    effective = parse_date_column(trades['Effective']).astype(np.int64)
+    maturity = parse_date_column(trades['Maturity']).astype(np.int64)
+    # Shift the dates so month ends, weekends and broken periods turn up
+    rng = np.random.default_rng(months)
+    effective = effective + rng.integers(-20, 20, len(effective))
+    maturity = maturity + rng.integers(-20, 20, len(maturity))
+
+    table = get_business_day_table(convention.calendar)
+    schedules = table.schedules(effective, maturity, months, ql.ModifiedFollowing, convention.schedule_rule,
+                                convention.end_of_month)
+
+    for row, (start, end) in enumerate(zip(effective, maturity)):
+        expected = ql_schedule(start, end, months, convention, convention.calendar)
+        generated = schedules[row][~np.isnan(schedules[row])].astype(np.int64).tolist()
+        assert generated == expected, f"{ql.Date(int(start))} to {ql.Date(int(end))}"
@@ -0,0 +1,28 @@
+# Name: test_cli.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Command line options that only apply to some pricing modes.
+
+import pytest
+
+from irs_pricing.cli import parse_arguments
+
+BASE = ['trades.csv', 'out.csv', '2013-03-11', '--curve', 'USD=usd.xlsx']
+
+
+def test_cross_check_with_vectorized_backend():
+    args = parse_arguments(BASE + ['--backend', 'vectorized', '--cross_check', '5'])
+    assert args.cross_check == 5
+
+
+@pytest.mark.parametrize('options', [
+    ['--cross_check', '5'],
+    ['--backend', 'vectorized', '--cross_check', '-1'],
+    ['--backend', 'vectorized', '--cross_check', '5', '--by_trade_date'],
+    ['--backend', 'vectorized', '--cross_check', '5', '--chunksize', '100'],
+    ['--backend', 'vectorized', '--cross_check', '5', '--follow'],
+])
+def test_cross_check_rejected_where_ignored(options, capsys):
+    with pytest.raises(SystemExit):
+        parse_arguments(BASE + options)
+    assert '--cross_check' in capsys.readouterr().err
@@ -0,0 +1,78 @@
+# Name: test_pricer.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Pricing against the original per-currency scripts and agreement of the backends.
+#
+# data/golden_prices.csv holds synthetic_trades(60, EVALUATION_DATE, seed=7) priced by the
+# price_swaps_<currency>.py scripts of the initial commit, one run per currency, on the
+# synthetic_curve sheets and the conftest fixings. The USD script's ql.UnitedStates() was read
+# as ql.UnitedStates(ql.UnitedStates.Settlement), the default of the QuantLib it was written for.
+# The EUR script reported Difference in percent with its own rate threshold; the package reports
+# every currency in basis points, so EUR differences are checked against the golden fair rates.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR, EVALUATION_DATE
+from irs_pricing import (CurveCache, get_run_metrics, price_by_trade_date, price_transactions, synthetic_curve,
+                         synthetic_trades, to_ql_date)
+
+GOLDEN_COLUMNS = ['Fair Rate', 'Difference']
+
+
+@pytest.fixture(scope='module')
+def golden():
+    return pd.read_csv(os.path.join(DATA_DIR, 'golden_prices.csv'))
+
+
+@pytest.mark.parametrize('backend', ['quantlib', 'vectorized'])
+def test_price_transactions_matches_per_currency_scripts(golden, yield_curves, fixings_dir, backend):
+    trades = golden.drop(columns=GOLDEN_COLUMNS)
+    priced = price_transactions(trades, yield_curves, to_ql_date(EVALUATION_DATE), fixings_dir, backend=backend)
+
+    assert len(priced) == len(golden)
+    assert (priced['Curr'] == golden['Curr']).all()
+    np.testing.assert_allclose(priced['Fair Rate'], golden['Fair Rate'], rtol=0, atol=1e-8)
+    fixed_rate = np.where(golden['Leg 1'] == 'FIXED', golden['Rate 1'], golden['Rate 2'])
+    fixed_rate = np.where(fixed_rate > 10, fixed_rate / 100, fixed_rate)
+    difference = np.where(golden['Curr'] == 'EUR', (fixed_rate - golden['Fair Rate']) * 100, golden['Difference'])
+    np.testing.assert_allclose(priced['Difference'], difference, rtol=0, atol=1e-6)
+
+
+def test_vectorized_agrees_with_quantlib(yield_curves, fixings_dir):
+    trades = synthetic_trades(400, EVALUATION_DATE, seed=3)
+    evaluation_date = to_ql_date(EVALUATION_DATE)
+    quantlib = price_transactions(trades, yield_curves, evaluation_date, fixings_dir, backend='quantlib')
+    vectorized = price_transactions(trades, yield_curves, evaluation_date, fixings_dir, backend='vectorized')
+
+    assert quantlib['Fair Rate'].notna().all()
+    np.testing.assert_allclose(vectorized['Fair Rate'], quantlib['Fair Rate'], rtol=0, atol=1e-8)
+    np.testing.assert_allclose(vectorized['Difference'], quantlib['Difference'], rtol=0, atol=1e-6)
+
+
+def test_missing_curve_skips_and_counts(yield_curves, fixings_dir):
+    trades = synthetic_trades(50, EVALUATION_DATE, seed=5)
+    curves = {currency: curve for currency, curve in yield_curves.items() if currency != 'USD'}
+    priced = price_transactions(trades, curves, to_ql_date(EVALUATION_DATE), fixings_dir)
+
+    assert not (priced['Curr'] == 'USD').any()
+    assert get_run_metrics().counters['skipped'] == (trades['Curr'] == 'USD').sum()
+
+
+def test_price_by_trade_date_skips_undated_and_unsupported_trades(fixings_dir):
+    trades = pd.concat([synthetic_trades(20, '2013-03-08', currencies=['USD', 'CAD'], seed=8),
+                        synthetic_trades(20, EVALUATION_DATE, currencies=['USD', 'CAD'], seed=9)], ignore_index=True)
+    trades.loc[3, 'Trade Time'] = 'yesterday'
+    trades.loc[4, 'Trade Time'] = None
+    trades.loc[25, 'Curr'] = 'JPY'
+    trades.loc[26, 'Curr'] = None
+    curve_cache = CurveCache(lambda currency, date: synthetic_curve(currency, date.to_date()))
+
+    priced = price_by_trade_date(trades, curve_cache, fixings_dir)
+
+    assert sorted(priced.index) == sorted(set(trades.index) - {3, 4, 25, 26})
+    assert priced['Fair Rate'].notna().all()
+    assert get_run_metrics().counters['skipped'] == 4
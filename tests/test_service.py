@@ -0,0 +1,53 @@
+# Name: test_service.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Reason codes of the resident pricing service.
+
+import numpy as np
+import pytest
+
+from conftest import EVALUATION_DATE
+from irs_pricing import PricingService, synthetic_curve, synthetic_trades
+
+
+@pytest.fixture
+def service(tmp_path, fixings_dir):
+    templates = {}
+    for currency in ('USD', 'CAD'):
+        path = tmp_path / f"{currency}_2013-03-11.xlsx"
+        synthetic_curve(currency, EVALUATION_DATE).to_excel(path, index=False)
+        templates[currency] = str(tmp_path / (currency + '_{date:%Y-%m-%d}.xlsx'))
+    return PricingService(templates, fixings_dir, small_batch=5)
+
+
+def test_every_unpriced_trade_has_a_reason(service):
+    trades = synthetic_trades(40, EVALUATION_DATE, currencies=['USD', 'CAD', 'EUR'], seed=6)
+    trades['Trade Time'] = trades['Trade Time'].astype(object)
+    trades.loc[0, 'Trade Time'] = 'not a time'
+    trades.loc[1, 'Trade Time'] = None
+    trades.loc[2, 'Curr'] = None
+    trades.loc[3, 'Curr'] = 'JPY'
+    trades.loc[4, 'Maturity'] = trades.loc[4, 'Effective']
+
+    fair_rate, difference, reasons = service.price(trades)
+
+    assert reasons[:5].tolist() == ['BAD_TRADE_TIME', 'BAD_TRADE_TIME', 'UNSUPPORTED_CURRENCY',
+                                    'UNSUPPORTED_CURRENCY', 'MATURITY_NOT_AFTER_EFFECTIVE']
+    eur = (trades['Curr'] == 'EUR').to_numpy().copy()
+    eur[:5] = False
+    assert eur.any() and (reasons[eur] == 'NO_CURVE').all()
+    unpriced = np.isnan(fair_rate)
+    assert all(reason is not None for reason in reasons[unpriced])
+    assert all(reason is None for reason in reasons[~unpriced])
+    assert not np.isnan(difference[~unpriced]).any()
+    assert (~unpriced).sum() == len(trades) - 5 - eur.sum()
+
+
+def test_evaluation_date_overrides_trade_time(service):
+    trades = synthetic_trades(10, EVALUATION_DATE, currencies=['USD'], seed=6)
+    trades['Trade Time'] = 'not a time'
+
+    fair_rate, _, reasons = service.price(trades, evaluation_date=EVALUATION_DATE)
+
+    assert not np.isnan(fair_rate).any()
+    assert all(reason is None for reason in reasons)
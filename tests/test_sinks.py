@@ -0,0 +1,87 @@
+# Name: test_sinks.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Every output sink writes back what it was given, in one chunk or several.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import EVALUATION_DATE
+from irs_pricing import SINKS, open_sink, synthetic_trades, write_results
+
+READERS = {
+    'csv': pd.read_csv,
+    'parquet': pd.read_parquet,
+    'feather': pd.read_feather,
+    'excel': pd.read_excel,
+}
+
+EXTENSIONS = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather', 'excel': '.xlsx'}
+
+
+def priced_trades(n, seed):
+    trades = synthetic_trades(n, EVALUATION_DATE, seed=seed)
+    rng = np.random.default_rng(seed)
+    return trades.assign(**{'Fair Rate': rng.uniform(0, 4, n), 'Difference': rng.normal(0, 20, n)})
+
+
+def assert_round_trip(read, expected):
+    assert list(read.columns) == list(expected.columns)
+    assert len(read) == len(expected)
+    for column in expected.columns:
+        if pd.api.types.is_numeric_dtype(expected[column]):
+            np.testing.assert_allclose(read[column].astype(float), expected[column].astype(float))
+        else:
+            assert read[column].fillna('').astype(str).tolist() == expected[column].fillna('').astype(str).tolist()
+
+
+@pytest.mark.parametrize('fmt', sorted(SINKS))
+def test_sink_round_trip(tmp_path, fmt):
+    results = priced_trades(30, seed=1)
+    path = str(tmp_path / f"out{EXTENSIONS[fmt]}")
+    write_results(results, path)
+
+    assert_round_trip(READERS[fmt](path), results)
+
+
+@pytest.mark.parametrize('fmt', sorted(SINKS))
+def test_sink_round_trip_in_chunks(tmp_path, fmt):
+    results = priced_trades(45, seed=2)
+    path = str(tmp_path / f"out{EXTENSIONS[fmt]}")
+    with open_sink(path) as sink:
+        for start in range(0, len(results), 20):
+            sink.write(results.iloc[start:start + 20])
+
+    assert sink.rows == len(results)
+    assert_round_trip(READERS[fmt](path), results)
+
+
+@pytest.mark.parametrize('fmt', sorted(SINKS))
+def test_sink_without_rows_writes_empty_file(tmp_path, fmt):
+    path = str(tmp_path / f"out{EXTENSIONS[fmt]}")
+    open_sink(path).close()
+
+    assert os.path.exists(path)
+    if fmt != 'csv':
+        assert READERS[fmt](path).empty
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'feather'])
+def test_sink_schema_does_not_follow_first_chunk(tmp_path, fmt):
+    results = priced_trades(20, seed=3).astype({'Not.': 'int64'})
+    results['Comment'] = None
+    first, second = results.iloc[:10].copy(), results.iloc[10:].copy()
+    # All missing in the first chunk only
+    first['PF 2'] = None
+    first['Fair Rate'] = np.nan
+    second['Comment'] = 'late fill'
+    second['Not.'] = second['Not.'] + 0.5
+    path = str(tmp_path / f"out{EXTENSIONS[fmt]}")
+    with open_sink(path) as sink:
+        sink.write(first)
+        sink.write(second)
+
+    assert_round_trip(READERS[fmt](path), pd.concat([first, second]))
@@ -0,0 +1,39 @@
+# Name: test_validation.py
+# Maintainer: Arnob L. Alam (arnoblalam@gmail.com)
+#
+# Description: Reason codes of the trade pre-screen.
+
+import numpy as np
+
+from conftest import EVALUATION_DATE
+from irs_pricing import screen_trades, synthetic_trades
+
+
+def test_screen_trades_reason_codes():
+    trades = synthetic_trades(8, EVALUATION_DATE, currencies=['USD'], seed=2)
+    trades['Not.'] = trades['Not.'].astype(object)
+    fixed_first = trades['Leg 1'] == 'FIXED'
+    trades.loc[1, 'Effective'] = 'not a date'
+    trades.loc[2, 'Maturity'] = trades.loc[2, 'Effective']
+    trades.loc[3, 'PF 1'] = '1T'
+    trades.loc[4, 'PF 2'] = 'quarterly'
+    trades.loc[5, 'Rate 1' if fixed_first[5] else 'Rate 2'] = np.nan
+    trades.loc[6, 'Not.'] = '25MM+'
+    # A row failing two checks gets the first code that applies
+    trades.loc[7, ['Effective', 'PF 1']] = [None, '1T']
+
+    accepted, rejects = screen_trades(trades)
+
+    assert accepted.index.tolist() == [0]
+    assert rejects['Reason'].to_dict() == {1: 'BAD_DATES', 2: 'MATURITY_NOT_AFTER_EFFECTIVE', 3: 'ONE_TIME_PAYMENT',
+                                           4: 'BAD_FREQUENCY', 5: 'MISSING_FIXED_RATE', 6: 'BAD_NOTIONAL',
+                                           7: 'BAD_DATES'}
+    assert rejects.loc[6, 'Not.'] == '25MM+'
+
+
+def test_screen_trades_accepts_clean_sheet():
+    trades = synthetic_trades(100, EVALUATION_DATE, seed=4)
+    accepted, rejects = screen_trades(trades)
+
+    assert len(accepted) == len(trades)
+    assert rejects.empty